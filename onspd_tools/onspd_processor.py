@@ -4,19 +4,53 @@ Enhanced ONS Postcode Directory processor
 Based on postcodes.io extraction logic (MIT License)
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import csv
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional, Any, Tuple
+import tempfile
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import cached_property
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Arrow-backed strings: contiguous buffers and Arrow compute kernels for .str methods
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+# Nullable pandas dtypes for Arrow columns, so integer columns with nulls stay integers
+ARROW_TO_PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.string(): STRING_DTYPE,
+}
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 @dataclass
 class ProcessingStats:
     """Statistics for processing operations"""
@@ -25,26 +59,49 @@ class ProcessingStats:
     terminated_postcodes: int = 0
     with_coordinates: int = 0
     processing_time: float = 0.0
+    failed_files: int = 0
+
+@dataclass(frozen=True)
+class CompiledFieldMappings:
+    """ONSPD field mappings resolved to source column positions for one CSV layout
+    
+    Field entries are (source index, depends_on index or None, output column),
+    with the part name appended for postcode part fields and the nullable
+    integer dtype appended for int fields.
+    """
+    columns: Tuple[str, ...]
+    sources: Tuple[int, ...]
+    doterm: Optional[int]
+    pcd: Optional[int]
+    missing: Tuple[str, ...]
+    strings: Tuple[Tuple[int, Optional[int], str], ...]
+    postcode_parts: Tuple[Tuple[int, Optional[int], str, str], ...]
+    ints: Tuple[Tuple[int, Optional[int], str, str], ...]
+    floats: Tuple[Tuple[int, Optional[int], str], ...]
     
 class ONSPDProcessor:
     """
     Enhanced ONS Postcode Directory processor based on postcodes.io logic
     """
     
+    # GSS placeholder codes meaning "not applicable"
+    PLACEHOLDER_CODES = ('E99999999', 'L99999999', 'M99999999', 'N99999999', 'S99999999', 'W99999999')
+    
     # Streamlined ONSPD field mappings - only essential user-friendly fields (~22 columns vs 42)
     # Removes GSS codes and technical abbreviations in favor of human-readable names
     ONSPD_FIELD_MAPPINGS = [
         # Core postcode fields
         {"column": "postcode", "onspd_code": "pcds"},
-        {"column": "pc_compact", "onspd_code": "pcds", "transform": lambda x: x.replace(" ", "") if x else ""},
-        {"column": "incode", "onspd_code": "pcds", "transform": lambda x: x.split(" ")[1] if x and " " in x else ""},
-        {"column": "outcode", "onspd_code": "pcds", "transform": lambda x: x.split(" ")[0] if x and " " in x else ""},
+        # Derived together from a single split of pcds (see _split_postcodes)
+        {"column": "pc_compact", "onspd_code": "pcds", "postcode_part": "compact"},
+        {"column": "incode", "onspd_code": "pcds", "postcode_part": "incode"},
+        {"column": "outcode", "onspd_code": "pcds", "postcode_part": "outcode"},
         
         # Geographic coordinates
         {"column": "latitude", "onspd_code": "lat", "type": "float", "depends_on": "osnrth1m"},
         {"column": "longitude", "onspd_code": "long", "type": "float", "depends_on": "oseast1m"},
-        {"column": "eastings", "onspd_code": "oseast1m", "type": "int"},
-        {"column": "northings", "onspd_code": "osnrth1m", "type": "int"},
+        {"column": "eastings", "onspd_code": "oseast1m", "type": "int", "dtype": "Int32"},
+        {"column": "northings", "onspd_code": "osnrth1m", "type": "int", "dtype": "Int32"},
         
         # Administrative boundaries (names only, no codes)
         {"column": "country", "onspd_code": "ctry"},
@@ -70,34 +127,55 @@ class ONSPDProcessor:
         {"column": "county_division", "onspd_code": "ced"},
         
         # Quality and metadata
-        {"column": "coordinate_quality", "onspd_code": "osgrdind", "type": "int"},
+        {"column": "coordinate_quality", "onspd_code": "osgrdind", "type": "int", "dtype": "Int16"},
         {"column": "date_introduced", "onspd_code": "dointr"},
         {"column": "date_of_termination", "onspd_code": "doterm"},
     ]
     
+    LOOKUP_TABLE_FILES = [
+        "countries.json", "districts.json", "constituencies.json",
+        "counties.json", "wards.json", "nhsHa.json", "regions.json",
+        "european_registers.json", "pcts.json", "ccgs.json",
+        "lsoa.json", "msoa.json", "nuts.json", "parishes.json",
+        "police_force_areas.json", "ceds.json"
+    ]
+    
+    # Normalized lookup tables as JSON; bump the version when _normalize_lookup_table changes
+    LOOKUP_CACHE_PATH = Path.home() / ".cache" / "uk_postcodes" / "lookups.json"
+    LOOKUP_CACHE_VERSION = 2
+    
+    # Nested layout of the enhanced dataset, keyed by postcode
+    ENHANCED_DATA_GROUPS = {
+        'coordinates': ['latitude', 'longitude', 'eastings', 'northings'],
+        'administrative': ['country', 'district', 'county', 'ward', 'parish', 'constituency', 'region'],
+        'healthcare': ['healthcare_region', 'primary_care_trust', 'nhs_health_authority'],
+        'statistical': ['lower_output_area', 'middle_output_area', 'statistical_region'],
+        'services': ['police_force', 'county_division'],
+        'quality': ['coordinate_quality', 'date_introduced'],
+    }
+    
     def __init__(self, data_dir: str = "../data"):
         self.data_dir = Path(data_dir)
-        self.lookup_tables = self._load_lookup_tables()
+        self._lookup_series = self._load_lookup_series()
         self.column_mapping = self._load_onspd_schema()
-        logger.info(f"Initialized processor with {len(self.lookup_tables)} lookup tables")
+        self._compiled_mappings: Dict[tuple, CompiledFieldMappings] = {}
+        self._csv_column_mappings: Dict[bytes, Dict[str, int]] = {}
+        logger.info(f"Initialized processor with {len(self._lookup_series)} lookup tables")
+    
+    @cached_property
+    def lookup_tables(self) -> Dict[str, Dict]:
+        """Raw JSON lookup tables, parsed on first access"""
+        return self._load_lookup_tables()
         
     def _load_lookup_tables(self) -> Dict[str, Dict]:
         """Load all JSON lookup tables from postcodes.io"""
         tables = {}
-        lookup_files = [
-            "countries.json", "districts.json", "constituencies.json",
-            "counties.json", "wards.json", "nhsHa.json", "regions.json",
-            "european_registers.json", "pcts.json", "ccgs.json",
-            "lsoa.json", "msoa.json", "nuts.json", "parishes.json",
-            "police_force_areas.json", "ceds.json"
-        ]
         
-        for file in lookup_files:
+        for file in self.LOOKUP_TABLE_FILES:
             file_path = self.data_dir / "lookup_tables" / file
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        tables[file.replace('.json', '')] = json.load(f)
+                    tables[file.replace('.json', '')] = _read_json(file_path)
                     logger.info(f"Loaded lookup table: {file}")
                 except Exception as e:
                     logger.warning(f"Failed to load {file}: {e}")
@@ -106,14 +184,48 @@ class ONSPDProcessor:
         
         return tables
     
+    def _load_lookup_series(self) -> Dict[str, pd.Series]:
+        """Load the normalized code -> name Series for every lookup table
+        
+        The normalized tables are cached as JSON in LOOKUP_CACHE_PATH, keyed by
+        the size and mtime of the source files, so those are only parsed and
+        normalized when a table changes. Unlike a pickle, loading the cache
+        can't run code from whatever file is at that path.
+        """
+        fingerprint = hashlib.sha256(str(self.LOOKUP_CACHE_VERSION).encode())
+        for file in self.LOOKUP_TABLE_FILES:
+            file_path = self.data_dir / "lookup_tables" / file
+            if file_path.exists():
+                file_stat = file_path.stat()
+                fingerprint.update(f"{file_path.resolve()}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode())
+        cache_key = fingerprint.hexdigest()
+        
+        try:
+            cached = _read_json(self.LOOKUP_CACHE_PATH)
+            if cached['key'] == cache_key:
+                logger.info(f"Loaded lookup tables from cache: {self.LOOKUP_CACHE_PATH}")
+                return {name: pd.Series(names, dtype=object) for name, names in cached['tables'].items()}
+        except Exception:
+            # Missing, stale format or unreadable cache: rebuild below
+            pass
+        
+        lookup_series = {name: self._normalize_lookup_table(table) for name, table in self.lookup_tables.items()}
+        cached = {'key': cache_key, 'tables': {name: series.to_dict() for name, series in lookup_series.items()}}
+        try:
+            self.LOOKUP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.LOOKUP_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(cached, f)
+        except OSError as e:
+            logger.warning(f"Could not write lookup table cache: {e}")
+        return lookup_series
+    
     def _load_onspd_schema(self) -> Dict[str, int]:
         """Load ONSPD schema and create column index mapping"""
         schema_path = self.data_dir / "schemas" / "onspd_schema.json"
         if not schema_path.exists():
             raise FileNotFoundError(f"ONSPD schema not found at {schema_path}")
         
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        schema = _read_json(schema_path)
         
         # Create column index mapping
         col_mapping = {item['code']: i for i, item in enumerate(schema)}
@@ -121,20 +233,165 @@ class ONSPDProcessor:
         return col_mapping
     
     def _get_csv_column_mapping(self, csv_path: str) -> Dict[str, int]:
-        """Get actual column mapping from CSV headers"""
+        """Get actual column mapping from CSV headers
+        
+        Mappings are cached by a hash of the raw header line, so files sharing
+        a layout (the usual case in multi_csv) reuse the parsed mapping.
+        """
         # Read just the header row to get actual column names
-        df_header = pd.read_csv(csv_path, nrows=0)
-        column_names = [col.lower() for col in df_header.columns]
+        with open(csv_path, 'rb') as f:
+            header_line = f.readline()
+        header_key = hashlib.blake2b(header_line, digest_size=8).digest()
+        
+        mapping = self._csv_column_mappings.get(header_key)
+        if mapping is not None:
+            return mapping
+        
+        header = next(csv.reader([header_line.decode('utf-8-sig')]), [])
+        column_names = []
+        seen = {}
+        for col in header:
+            col = col.lower()
+            # Make duplicate names unique the way pandas does (name, name.1, ...)
+            if col in seen:
+                seen[col] += 1
+                col = f"{col}.{seen[col]}"
+            else:
+                seen[col] = 0
+            column_names.append(col)
         
         # Create mapping from column names to indices
         mapping = {col: i for i, col in enumerate(column_names)}
+        self._csv_column_mappings[header_key] = mapping
         
         logger.debug(f"CSV columns found: {list(mapping.keys())}")
         return mapping
     
-    def process_onspd_csv_directory(self, csv_directory: str, chunk_size: int = 50000) -> pd.DataFrame:
+    def _read_onspd_csv(self, csv_path: str, chunk_size: int = 50000) -> Tuple[Iterator[pd.DataFrame], Dict[str, int]]:
+        """Open a chunked CSV reader that only parses the ONSPD columns we use
+        
+        Uses PyArrow's streaming CSV reader with a projected schema.
+        Returns the chunk iterator together with the column mapping for the
+        projected chunks. Every column is read as a string and numeric source
+        columns are cast to their output dtypes once terminated and repeated
+        header rows are filtered out, so one malformed value nulls that cell
+        instead of failing the whole file.
+        """
+        csv_column_mapping = self._get_csv_column_mapping(csv_path)
+        column_names = sorted(csv_column_mapping, key=csv_column_mapping.get)
+        
+        needed = {'doterm', 'pcd'}
+        source_types = {}
+        for field_def in self.ONSPD_FIELD_MAPPINGS:
+            needed.add(field_def['onspd_code'])
+            if field_def.get('type'):
+                # Cast to the output type after filtering (Int32 grid refs, float64 coordinates, ...)
+                source_types[field_def['onspd_code']] = self._field_arrow_type(field_def)
+            if 'depends_on' in field_def:
+                needed.add(field_def['depends_on'])
+                source_types.setdefault(field_def['depends_on'], pa.float64())
+        
+        # Keep file order so positions in the projected chunks are predictable
+        usecols = [col for col in column_names if col in needed]
+        column_types = {col: pa.string() for col in usecols}
+        numeric_types = {col: source_types[col] for col in usecols if col in source_types}
+        
+        reader = pa_csv.open_csv(
+            csv_path,
+            # Header is replaced by the lower-cased names from the column mapping
+            read_options=pa_csv.ReadOptions(column_names=column_names, skip_rows=1, block_size=64 << 20),
+            convert_options=pa_csv.ConvertOptions(include_columns=usecols, column_types=column_types,
+                                                  null_values=[''], strings_can_be_null=True),
+        )
+        # Row filters are resolved once per file and applied to whole Arrow batches.
+        # pcd is only needed to spot repeated header rows, so it is dropped afterwards.
+        doterm_column = 'doterm' if 'doterm' in usecols else None
+        pcd_column = 'pcd' if 'pcd' in usecols else None
+        mapped_codes = {field_def['onspd_code'] for field_def in self.ONSPD_FIELD_MAPPINGS}
+        output_columns = [col for col in usecols if col != 'pcd' or 'pcd' in mapped_codes]
+        
+        chunks = self._iter_record_batches(reader, chunk_size, doterm_column, pcd_column, output_columns,
+                                           numeric_types)
+        return chunks, {col: i for i, col in enumerate(output_columns)}
+    
+    @classmethod
+    def _iter_record_batches(cls, reader: pa_csv.CSVStreamingReader, chunk_size: int,
+                             doterm_column: Optional[str] = None, pcd_column: Optional[str] = None,
+                             output_columns: Optional[List[str]] = None,
+                             numeric_types: Optional[Dict[str, pa.DataType]] = None) -> Iterator[pd.DataFrame]:
+        """Yield DataFrames of at most chunk_size rows from a streaming CSV reader
+        
+        Terminated postcodes (doterm_column) and repeated header rows
+        (pcd_column) are dropped from each Arrow batch before it is converted
+        to pandas, keeping only output_columns if given. String columns named
+        in numeric_types are then cast to their Arrow type.
+        """
+        for batch in reader:
+            if doterm_column is not None:
+                # Same test as _process_chunk: empty/'nan' termination dates mean active
+                doterm = pc.utf8_lower(pc.utf8_trim_whitespace(batch.column(doterm_column)))
+                active = pc.or_kleene(pc.is_null(doterm), pc.is_in(doterm, value_set=pa.array(['', 'nan'])))
+                batch = batch.filter(active)
+            
+            if pcd_column is not None:
+                # Skip header rows
+                pcd = pc.utf8_lower(pc.utf8_trim_whitespace(batch.column(pcd_column)))
+                batch = batch.filter(pc.invert(pc.fill_null(pc.equal(pcd, 'pcd'), False)))
+            
+            if output_columns is not None:
+                batch = batch.select(output_columns)
+            
+            if numeric_types:
+                arrays = [cls._cast_numeric_column(column, numeric_types[name]) if name in numeric_types else column
+                          for name, column in zip(batch.schema.names, batch.columns)]
+                batch = pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+            
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size).to_pandas(types_mapper=ARROW_TO_PANDAS_TYPES.get)
+    
+    @staticmethod
+    def _cast_numeric_column(column: pa.Array, arrow_type: pa.DataType) -> pa.Array:
+        """Cast a string column to a numeric Arrow type, nulling unparseable values
+        
+        Arrow's cast handles clean columns; one with a malformed value goes
+        through pd.to_numeric(errors='coerce') instead, truncating for integer
+        types, the same as _process_chunk does for string source columns.
+        """
+        try:
+            return pc.cast(column, arrow_type)
+        except pa.ArrowInvalid:
+            values = pd.to_numeric(pd.Series(column.to_numpy(zero_copy_only=False)).str.strip(), errors='coerce')
+            if pa.types.is_integer(arrow_type):
+                values = np.trunc(values)
+            return pa.array(values, type=arrow_type, from_pandas=True)
+    
+    @classmethod
+    def _output_schema(cls) -> pa.Schema:
+        """Arrow schema of the DataFrames produced by _process_chunk"""
+        return pa.schema([(field_def['column'], cls._field_arrow_type(field_def)) for field_def in cls.ONSPD_FIELD_MAPPINGS])
+    
+    @staticmethod
+    def _field_arrow_type(field_def: Dict[str, Any]) -> pa.DataType:
+        """Arrow type of an ONSPD_FIELD_MAPPINGS output column"""
+        if field_def.get('type') == 'int':
+            return pa.from_numpy_dtype(pd.api.types.pandas_dtype(field_def.get('dtype', 'Int64')).numpy_dtype)
+        if field_def.get('type') == 'float':
+            return pa.float64()
+        return pa.string()
+    
+    def process_onspd_csv_directory(self, csv_directory: str, chunk_size: int = 50000,
+                                    output_path: Optional[str] = None,
+                                    max_workers: Optional[int] = None) -> pd.DataFrame:
         """
         Process all CSV files in a directory (e.g., multi_csv from ONSPD)
+        
+        Processed chunks are streamed into a single Parquet file as they are
+        produced and read back once at the end, so no per-file DataFrames are
+        held in memory or concatenated. The Parquet file is written to
+        output_path if given, otherwise to a temporary directory.
+        
+        Files are processed in parallel by up to max_workers processes
+        (default: one per CPU); max_workers=1 processes them in this process.
         """
         csv_dir = Path(csv_directory)
         if not csv_dir.exists():
@@ -147,26 +404,53 @@ class ONSPDProcessor:
         
         logger.info(f"Found {len(csv_files)} CSV files to process")
         
-        all_chunks = []
-        stats = ProcessingStats()
-        start_time = time.time()
+        workers = min(max_workers or os.cpu_count() or 1, len(csv_files))
         
-        for i, csv_file in enumerate(csv_files, 1):
-            logger.info(f"Processing file {i}/{len(csv_files)}: {csv_file.name}")
-            file_stats = self.process_onspd_csv(str(csv_file), chunk_size=chunk_size)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            parquet_path = output_path or os.path.join(temp_dir, 'onspd_processed.parquet')
+            part_paths = [os.path.join(temp_dir, f'part_{i:04d}.parquet') for i in range(len(csv_files))]
+            schema = self._output_schema()
+            stats = ProcessingStats()
+            start_time = time.time()
             
-            if len(file_stats) > 0:
-                all_chunks.append(file_stats)
-                stats.total_rows_processed += len(file_stats)
-                stats.active_postcodes += len(file_stats[file_stats['date_of_termination'].isna()])
-                stats.with_coordinates += len(file_stats.dropna(subset=['latitude', 'longitude']))
-        
-        if not all_chunks:
-            logger.warning("No data processed from any CSV files")
-            return pd.DataFrame()
-        
-        logger.info("Combining all processed data...")
-        combined_df = pd.concat(all_chunks, ignore_index=True)
+            # Files are independent: each one is processed into its own Parquet part
+            if workers > 1:
+                logger.info(f"Processing files with {workers} worker processes")
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(type(self), str(self.data_dir))) as executor:
+                    futures = [executor.submit(_process_csv_file_in_worker, str(csv_file), part_path, chunk_size)
+                               for csv_file, part_path in zip(csv_files, part_paths)]
+                    file_results = [future.result() for future in as_completed(futures)]
+            else:
+                file_results = []
+                for i, (csv_file, part_path) in enumerate(zip(csv_files, part_paths), 1):
+                    logger.info(f"Processing file {i}/{len(csv_files)}: {csv_file.name}")
+                    file_results.append(self._process_csv_file_to_parquet(str(csv_file), part_path, chunk_size))
+            
+            for file_stats in file_results:
+                stats.total_rows_processed += file_stats.total_rows_processed
+                stats.active_postcodes += file_stats.active_postcodes
+                stats.with_coordinates += file_stats.with_coordinates
+                stats.failed_files += file_stats.failed_files
+            
+            if stats.failed_files:
+                logger.warning(f"{stats.failed_files} of {len(csv_files)} CSV files failed and were skipped; "
+                               f"their postcodes are missing from the output")
+            
+            # Stitch the parts together in file order
+            with pq.ParquetWriter(parquet_path, schema) as writer:
+                for part_path in part_paths:
+                    if os.path.exists(part_path):
+                        for batch in pq.ParquetFile(part_path).iter_batches():
+                            writer.write_batch(batch)
+            
+            if stats.total_rows_processed == 0:
+                logger.warning("No data processed from any CSV files")
+                return pd.DataFrame()
+            
+            logger.info("Loading combined processed data...")
+            # Same dtypes as _process_chunk output: nullable integers and Arrow-backed strings
+            combined_df = pq.read_table(parquet_path).to_pandas(types_mapper=ARROW_TO_PANDAS_TYPES.get)
         
         stats.processing_time = time.time() - start_time
         stats.terminated_postcodes = stats.total_rows_processed - stats.active_postcodes
@@ -181,121 +465,204 @@ class ONSPDProcessor:
         
         return combined_df
     
-    def process_onspd_csv(self, csv_path: str, chunk_size: int = 50000) -> pd.DataFrame:
+    def _process_csv_file_to_parquet(self, csv_path: str, part_path: str, chunk_size: int = 50000) -> ProcessingStats:
+        """Stream one ONSPD CSV file into a Parquet part file
+        
+        No part file is left behind if the CSV fails to process.
+        """
+        try:
+            with pq.ParquetWriter(part_path, self._output_schema()) as writer:
+                return self.process_onspd_csv(csv_path, writer, chunk_size=chunk_size)
+        except Exception as e:
+            logger.error(f"Error processing {Path(csv_path).name}: {e}")
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return ProcessingStats(failed_files=1)
+    
+    def process_onspd_csv(self, csv_path: str, writer: pq.ParquetWriter, chunk_size: int = 50000) -> ProcessingStats:
         """
         Process ONSPD CSV file using postcodes.io logic with chunked processing
+        
+        Each processed chunk is written to writer (opened with _output_schema())
+        as soon as it is ready, so at most one chunk is held in memory.
+        Returns the row counts for the file.
         """
         csv_file = Path(csv_path)
         if not csv_file.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
-        logger.debug(f"Processing CSV: {csv_file.name}")
-        
-        # Get dynamic column mapping from actual CSV headers
-        csv_column_mapping = self._get_csv_column_mapping(csv_path)
-        
-        # Process CSV in chunks for memory efficiency
-        chunks = []
-        chunk_count = 0
-        
-        try:
-            for chunk in pd.read_csv(csv_path, chunksize=chunk_size, header=0, 
-                                   dtype=str, na_values=[''], keep_default_na=False,
-                                   encoding='utf-8', low_memory=False):
-                chunk_count += 1
-                processed_chunk = self._process_chunk(chunk, csv_column_mapping)
-                if not processed_chunk.empty:
-                    chunks.append(processed_chunk)
-                
-                if chunk_count % 10 == 0:
-                    logger.debug(f"  Processed {chunk_count} chunks from {csv_file.name}")
-        
-        except Exception as e:
-            logger.error(f"Error processing {csv_file.name}: {e}")
-            return pd.DataFrame()
+        schema = self._output_schema()
+        file_stats = ProcessingStats()
+        for processed_chunk in self._iter_processed_chunks(csv_path, chunk_size):
+            writer.write_table(pa.Table.from_pandas(processed_chunk, schema=schema, preserve_index=False))
+            file_stats.total_rows_processed += len(processed_chunk)
+            file_stats.active_postcodes += int(processed_chunk['date_of_termination'].isna().sum())
+            file_stats.with_coordinates += int((processed_chunk['latitude'].notna() & processed_chunk['longitude'].notna()).sum())
         
-        if not chunks:
+        if file_stats.total_rows_processed == 0:
             logger.warning(f"No valid data found in {csv_file.name}")
-            return pd.DataFrame()
+        else:
+            logger.debug(f"  Extracted {file_stats.total_rows_processed:,} postcodes from {csv_file.name}")
+        return file_stats
+    
+    def _iter_processed_chunks(self, csv_path: str, chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+        """Yield processed, non-empty chunks of an ONSPD CSV file"""
+        csv_name = Path(csv_path).name
+        logger.debug(f"Processing CSV: {csv_name}")
         
-        result = pd.concat(chunks, ignore_index=True)
-        logger.debug(f"  Extracted {len(result):,} postcodes from {csv_file.name}")
-        return result
+        # Get dynamic column mapping from actual CSV headers
+        reader, csv_column_mapping = self._read_onspd_csv(csv_path, chunk_size=chunk_size)
+        for chunk_count, chunk in enumerate(reader, 1):
+            processed_chunk = self._process_chunk(chunk, csv_column_mapping)
+            if not processed_chunk.empty:
+                yield processed_chunk
+            
+            if chunk_count % 10 == 0:
+                logger.debug(f"  Processed {chunk_count} chunks from {csv_name}")
+    
+    def _compile_mappings(self, csv_column_mapping: Dict[str, int], num_columns: int) -> CompiledFieldMappings:
+        """Resolve ONSPD_FIELD_MAPPINGS against a CSV column layout
+        
+        The result is cached per layout, so only the first chunk of each new
+        layout pays for walking the field definitions.
+        """
+        key = (tuple(csv_column_mapping.items()), num_columns)
+        compiled = self._compiled_mappings.get(key)
+        if compiled is not None:
+            return compiled
+        
+        def resolve(onspd_code: Optional[str]) -> Optional[int]:
+            idx = csv_column_mapping.get(onspd_code, -1) if onspd_code else -1
+            return idx if 0 <= idx < num_columns else None
+        
+        missing, strings, postcode_parts, ints, floats = [], [], [], [], []
+        for field_def in self.ONSPD_FIELD_MAPPINGS:
+            src = resolve(field_def['onspd_code'])
+            if src is None:
+                missing.append(field_def['column'])
+                continue
+            
+            entry = (src, resolve(field_def.get('depends_on')), field_def['column'])
+            if 'postcode_part' in field_def:
+                postcode_parts.append(entry + (field_def['postcode_part'],))
+            elif field_def.get('type') == 'int':
+                ints.append(entry + (field_def.get('dtype', 'Int64'),))
+            elif field_def.get('type') == 'float':
+                floats.append(entry)
+            else:
+                strings.append(entry)
+        
+        sources = {entry[0] for entry in strings + postcode_parts + ints + floats}
+        sources.update(entry[1] for entry in strings + postcode_parts + ints + floats if entry[1] is not None)
+        
+        compiled = CompiledFieldMappings(
+            columns=tuple(field_def['column'] for field_def in self.ONSPD_FIELD_MAPPINGS),
+            sources=tuple(sorted(sources)),
+            doterm=resolve('doterm'),
+            pcd=resolve('pcd'),
+            missing=tuple(missing),
+            strings=tuple(strings),
+            postcode_parts=tuple(postcode_parts),
+            ints=tuple(ints),
+            floats=tuple(floats),
+        )
+        self._compiled_mappings[key] = compiled
+        return compiled
     
     def _process_chunk(self, chunk: pd.DataFrame, csv_column_mapping: Dict[str, int] = None) -> pd.DataFrame:
-        """Process a chunk of ONSPD data using dynamic column mapping"""
+        """Process a chunk of ONSPD data using dynamic column mapping
+        
+        Every field is derived with whole-column pandas operations rather than
+        walking the chunk row by row.
+        """
         if csv_column_mapping is None:
             csv_column_mapping = self.column_mapping
-        
-        processed_rows = []
-        
-        for _, row in chunk.iterrows():
-            # Skip terminated postcodes (same logic as postcodes.io)
-            doterm_idx = csv_column_mapping.get('doterm', -1)
-            if doterm_idx >= 0 and doterm_idx < len(row):
-                doterm_val = str(row.iloc[doterm_idx]).strip()
-                if doterm_val and doterm_val != 'nan' and len(doterm_val) > 0:
-                    continue
-                
-            # Skip header rows
-            pcd_idx = csv_column_mapping.get('pcd', -1)
-            if pcd_idx >= 0 and pcd_idx < len(row):
-                if str(row.iloc[pcd_idx]).strip().lower() == 'pcd':
-                    continue
-            
-            processed_row = {}
-            
-            # Extract fields using postcodes.io mapping
-            for field_def in self.ONSPD_FIELD_MAPPINGS:
-                onspd_idx = csv_column_mapping.get(field_def['onspd_code'], -1)
-                if onspd_idx >= 0 and onspd_idx < len(row):
-                    value = str(row.iloc[onspd_idx]).strip()
-                    
-                    # Handle empty values
-                    if not value or value.lower() == 'nan':
-                        value = None
-                    
-                    # Check dependencies (postcodes.io logic: coordinates depend on eastings/northings)
-                    if 'depends_on' in field_def:
-                        depends_idx = csv_column_mapping.get(field_def['depends_on'], -1)
-                        if depends_idx >= 0 and depends_idx < len(row):
-                            depends_val = str(row.iloc[depends_idx]).strip()
-                            # Per postcodes.io line 852-860: coordinates are null if eastings/northings are empty
-                            if not depends_val or depends_val.lower() == 'nan' or depends_val == '' or depends_val == '0':
-                                value = None
-                    
-                    # Apply transformations
-                    if 'transform' in field_def and value:
-                        try:
-                            value = field_def['transform'](value)
-                        except Exception as e:
-                            logger.debug(f"Transform failed for {field_def['column']}: {e}")
-                            value = None
-                    
-                    # Type conversion
-                    if value and field_def.get('type'):
-                        try:
-                            if field_def['type'] == 'int':
-                                value = int(float(value))
-                            elif field_def['type'] == 'float':
-                                value = float(value)
-                        except (ValueError, TypeError):
-                            value = None
-                    
-                    processed_row[field_def['column']] = value
+        compiled = self._compile_mappings(csv_column_mapping, chunk.shape[1])
+        
+        # Skip terminated postcodes (same logic as postcodes.io)
+        keep = pd.Series(True, index=chunk.index)
+        if compiled.doterm is not None:
+            keep &= self._clean_source_values(chunk.iloc[:, compiled.doterm]).isna()
+        
+        # Skip header rows
+        if compiled.pcd is not None:
+            keep &= self._clean_source_values(chunk.iloc[:, compiled.pcd]).str.lower().ne('pcd').fillna(True)
+        
+        chunk = chunk.loc[keep]
+        sources = {idx: self._clean_source_values(chunk.iloc[:, idx]) for idx in compiled.sources}
+        
+        def field_values(src: int, depends: Optional[int]) -> pd.Series:
+            values = sources[src]
+            if depends is not None:
+                # Per postcodes.io line 852-860: coordinates are null if eastings/northings are empty
+                depends_values = sources[depends]
+                if pd.api.types.is_numeric_dtype(depends_values) and pd.api.types.is_float_dtype(values):
+                    # Typed columns from the CSV reader: mask directly on the numpy arrays
+                    depends_array = depends_values.to_numpy(dtype=np.float64, na_value=np.nan)
+                    valid = (depends_array != 0) & ~np.isnan(depends_array)
+                    values = pd.Series(np.where(valid, values.to_numpy(), np.nan), index=values.index)
                 else:
-                    processed_row[field_def['column']] = None
-            
-            # Add human-readable names using lookup tables
-            self._add_human_readable_names(processed_row)
-            
-            # Only add row if we have a valid postcode
-            if processed_row.get('postcode'):
-                processed_rows.append(processed_row)
+                    zero = 0 if pd.api.types.is_numeric_dtype(depends_values) else '0'
+                    values = values.where(depends_values.notna() & depends_values.ne(zero).fillna(False))
+            return values
+        
+        # Extract fields using postcodes.io mapping
+        processed = {column: None for column in compiled.missing}
+        for src, depends, column in compiled.strings:
+            processed[column] = field_values(src, depends)
+        split_postcodes = {}
+        for src, depends, column, part in compiled.postcode_parts:
+            if (src, depends) not in split_postcodes:
+                split_postcodes[src, depends] = self._split_postcodes(field_values(src, depends))
+            processed[column] = split_postcodes[src, depends][part]
+        for src, depends, column, dtype in compiled.ints:
+            values = field_values(src, depends)
+            if not pd.api.types.is_integer_dtype(values):
+                values = np.trunc(pd.to_numeric(values, errors='coerce'))
+            # Smallest nullable integer that fits (Int32 grid refs, Int16 quality)
+            processed[column] = values.astype(dtype)
+        for src, depends, column in compiled.floats:
+            processed[column] = pd.to_numeric(field_values(src, depends), errors='coerce')
+        
+        processed = pd.DataFrame(processed, index=chunk.index, columns=list(compiled.columns))
+        
+        # Add human-readable names using lookup tables
+        self._add_human_readable_names(processed)
+        
+        # Only keep rows with a valid postcode
+        processed = processed[processed['postcode'].notna()]
+        return processed.reset_index(drop=True)
+    
+    @staticmethod
+    def _split_postcodes(postcodes: pd.Series) -> Dict[str, pd.Series]:
+        """Derive the compact form, incode and outcode from one split of the postcodes
+        
+        Postcodes without a space get an empty incode and outcode; missing
+        postcodes stay missing.
+        """
+        parts = postcodes.str.split(' ', n=2, expand=True).reindex(columns=[0, 1])
+        has_space = parts[1].notna()
+        present = postcodes.notna()
+        return {
+            'compact': postcodes.str.replace(' ', '', regex=False),
+            'incode': parts[1].astype(STRING_DTYPE).fillna('').where(present),
+            'outcode': parts[0].astype(STRING_DTYPE).where(has_space, '').where(present),
+        }
+    
+    @staticmethod
+    def _clean_source_values(values: pd.Series) -> pd.Series:
+        """Clean an ONSPD source column
         
-        return pd.DataFrame(processed_rows)
+        Values are stripped, and empty/'nan' cells become missing.
+        """
+        if pd.api.types.is_numeric_dtype(values):
+            # Already parsed by the CSV reader
+            return values
+        
+        values = values.astype(STRING_DTYPE).str.strip()
+        return values.mask(values.eq('') | values.str.lower().eq('nan'))
     
-    def _add_human_readable_names(self, row: Dict):
+    def _add_human_readable_names(self, df: pd.DataFrame):
         """Add human-readable names using lookup tables"""
         mappings = [
             ('country', 'countries', 'country'),
@@ -317,68 +684,91 @@ class ONSPDProcessor:
             ('nhs_health_authority', 'nhsHa', 'nhs_health_authority'),
         ]
         
+        # GSS code columns have few distinct values: collect the distinct
+        # (table, code) pairs of every column and resolve them in one join
+        resolved = []
         for code_field, table_name, name_field in mappings:
-            code = row.get(code_field)
-            
-            # Handle placeholder codes and missing/invalid codes
-            if not code or code in ['E99999999', 'L99999999', 'M99999999', 'N99999999', 'S99999999', 'W99999999']:
-                # E99999999, L99999999, etc. are placeholders for "not applicable"
-                row[name_field] = None
-                continue
-                
-            if table_name not in self.lookup_tables:
+            if table_name not in self._lookup_series:
                 # Lookup table not available
-                row[name_field] = None
+                df[name_field] = None
                 continue
-                
-            lookup_table = self.lookup_tables[table_name]
-            lookup_result = None
-            
-            if isinstance(lookup_table, dict):
-                if code in lookup_table:
-                    lookup_result = lookup_table[code]
-                    
-                    # Handle different lookup table formats
-                    if isinstance(lookup_result, dict):
-                        # For CCG, NUTS etc. that have nested structure
-                        if 'name' in lookup_result:
-                            row[name_field] = lookup_result['name']
-                        elif 'value' in lookup_result:
-                            row[name_field] = lookup_result['value']
-                        else:
-                            # Fallback: take the whole dict (will be handled by clean_value)
-                            row[name_field] = lookup_result
-                    else:
-                        # Simple string lookup
-                        row[name_field] = lookup_result
-                else:
-                    # GSS code not found in lookup table
-                    logger.debug(f"GSS code '{code}' not found in {table_name} lookup table")
-                    row[name_field] = None
-                        
-            elif isinstance(lookup_table, list):
-                # Array-based lookup (find by code field)
-                match = next((item for item in lookup_table if item.get('code') == code), None)
-                if match:
-                    if isinstance(match, dict):
-                        row[name_field] = match.get('name', match.get('value'))
-                    else:
-                        row[name_field] = match
-                else:
-                    # GSS code not found in lookup table
-                    logger.debug(f"GSS code '{code}' not found in {table_name} lookup table")
-                    row[name_field] = None
-            else:
-                # Unknown lookup table format
-                row[name_field] = None
+            resolved.append((table_name, name_field, df[code_field].astype('category').cat))
+        
+        if not resolved:
+            return
+        
+        keys = pd.MultiIndex.from_arrays([
+            np.repeat([table_name for table_name, _, _ in resolved], [len(codes.categories) for _, _, codes in resolved]),
+            np.concatenate([codes.categories.to_numpy(dtype=object) for _, _, codes in resolved]),
+        ])
+        names = self._combined_lookup.reindex(keys).to_numpy(dtype=object)
+        
+        for table_name, code in keys[pd.isna(names)]:
+            if code not in self.PLACEHOLDER_CODES:
+                # GSS code not found in lookup table
+                logger.debug(f"GSS code '{code}' not found in {table_name} lookup table")
+        
+        offset = 0
+        for table_name, name_field, codes in resolved:
+            category_names = names[offset:offset + len(codes.categories)]
+            offset += len(codes.categories)
+            # Scatter the resolved names back to rows through the category codes (-1 = missing)
+            positions = codes.codes.to_numpy()
+            values = np.full(len(positions), None, dtype=object)
+            present = positions >= 0
+            values[present] = category_names[positions[present]]
+            df[name_field] = pd.Series(values, index=df.index, dtype=STRING_DTYPE)
+    
+    @cached_property
+    def _combined_lookup(self) -> pd.Series:
+        """All lookup Series in one Series indexed by (table name, GSS code)"""
+        if not self._lookup_series:
+            return pd.Series(dtype=object, index=pd.MultiIndex.from_arrays([[], []]))
+        return pd.concat(self._lookup_series)
+    
+    @classmethod
+    def _normalize_lookup_table(cls, lookup_table: Any) -> pd.Series:
+        """Normalize a postcodes.io lookup table into a Series of names indexed by GSS code"""
+        if isinstance(lookup_table, dict):
+            items = lookup_table.items()
+        elif isinstance(lookup_table, list):
+            # Array-based lookup (records carry their own code field)
+            items = ((item.get('code'), item) for item in lookup_table if isinstance(item, dict))
+        else:
+            # Unknown lookup table format
+            items = ()
+        
+        names = {}
+        for code, record in items:
+            # Placeholders (E99999999 etc.) mean "not applicable" and never resolve
+            if not code or code in cls.PLACEHOLDER_CODES:
+                continue
+            if isinstance(record, dict):
+                # For CCG, NUTS etc. that have nested structure
+                if 'name' in record:
+                    record = record['name']
+                elif 'value' in record:
+                    record = record['value']
+                elif isinstance(lookup_table, list):
+                    record = None
+                # Otherwise take the whole dict (will be handled by clean_value)
+            if record is not None:
+                names.setdefault(code, record)
+        
+        return pd.Series(names, dtype=object)
 
     def generate_enhanced_postcode_data(self, onspd_csv_directory: str, 
-                                      output_path: str = None) -> str:
-        """Generate enhanced postcode dataset"""
+                                      output_path: str = None, max_workers: Optional[int] = None) -> str:
+        """Generate enhanced postcode dataset
+        
+        Written as Parquet (one struct column per ENHANCED_DATA_GROUPS entry)
+        unless output_path ends in .json (JSON object keyed by postcode) or
+        .py (legacy Python dict file).
+        """
         logger.info("Starting enhanced postcode dataset generation...")
         
         # Process all ONSPD data
-        df = self.process_onspd_csv_directory(onspd_csv_directory)
+        df = self.process_onspd_csv_directory(onspd_csv_directory, max_workers=max_workers)
         
         if df.empty:
             raise ValueError("No data processed from ONSPD files")
@@ -388,53 +778,6 @@ class ONSPDProcessor:
         active_df = df[df['date_of_termination'].isna() | (df['date_of_termination'] == '')]
         logger.info(f"Active postcodes: {len(active_df):,} out of {len(df):,}")
         
-        # Create the enhanced dataset
-        logger.info("Creating enhanced dataset structure...")
-        enhanced_data = {}
-        
-        for _, row in active_df.iterrows():
-            postcode = row['postcode']
-            if not postcode:
-                continue
-                
-            enhanced_data[postcode] = {
-                'coordinates': {
-                    'latitude': row.get('latitude'),
-                    'longitude': row.get('longitude'),
-                    'eastings': row.get('eastings'),
-                    'northings': row.get('northings'),
-                },
-                'administrative': {
-                    'country': row.get('country'),
-                    'district': row.get('district'),
-                    'county': row.get('county'),
-                    'ward': row.get('ward'),
-                    'parish': row.get('parish'),
-                    'constituency': row.get('constituency'),
-                    'region': row.get('region'),
-                },
-                'healthcare': {
-                    'healthcare_region': row.get('healthcare_region'),
-                    'primary_care_trust': row.get('primary_care_trust'),
-                    'nhs_health_authority': row.get('nhs_health_authority'),
-                },
-                'statistical': {
-                    'lower_output_area': row.get('lower_output_area'),
-                    'middle_output_area': row.get('middle_output_area'),
-                    'statistical_region': row.get('statistical_region'),
-                },
-                'services': {
-                    'police_force': row.get('police_force'),
-                    'county_division': row.get('county_division'),
-                },
-                'quality': {
-                    'coordinate_quality': row.get('coordinate_quality', 1),
-                    'date_introduced': row.get('date_introduced'),
-                },
-                'incode': row.get('incode'),
-                'outcode': row.get('outcode'),
-            }
-        
         # Output format
         if output_path:
             output_file = output_path
@@ -442,31 +785,127 @@ class ONSPDProcessor:
             # Use current date
             import datetime
             date_str = datetime.datetime.now().strftime('%Y_%m')
-            output_file = f"enhanced_postcodes_{date_str}.py"
+            output_file = f"enhanced_postcodes_{date_str}.parquet"
         
         logger.info(f"Writing enhanced dataset to {output_file}...")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Enhanced UK Postcodes Dataset\n")
-            f.write(f"# Generated on {pd.Timestamp.now()}\n")
-            f.write(f"# Based on postcodes.io extraction logic (MIT License)\n")
-            f.write(f"# Total active postcodes: {len(enhanced_data):,}\n")
-            f.write(f"# Source: ONS Postcode Directory\n\n")
-            f.write("ENHANCED_POSTCODE_DATA = ")
-            
-            # Write the data in a more readable format
-            import pprint
-            formatted_data = pprint.pformat(enhanced_data, width=120, indent=4)
-            f.write(formatted_data)
-            f.write("\n")
+        if output_file.endswith('.py'):
+            postcode_count = self._write_enhanced_python(active_df, output_file)
+        elif output_file.endswith('.json'):
+            postcode_count = self._write_enhanced_json(active_df, output_file)
+        else:
+            postcode_count = self._write_enhanced_parquet(active_df, output_file)
         
         file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
         logger.info(f"Enhanced dataset generated successfully!")
         logger.info(f"  Output file: {output_file}")
         logger.info(f"  File size: {file_size_mb:.1f} MB")
-        logger.info(f"  Postcodes: {len(enhanced_data):,}")
+        logger.info(f"  Postcodes: {postcode_count:,}")
         
         return output_file
+    
+    def _write_enhanced_parquet(self, active_df: pd.DataFrame, output_file: str) -> int:
+        """Write the enhanced dataset as a zstd-compressed Parquet file"""
+        # Same semantics as the dict output: one entry per postcode, last one wins
+        active_df = active_df.drop_duplicates(subset='postcode', keep='last')
+        schema = self._output_schema()
+        
+        def column_array(column: str) -> pa.Array:
+            return pa.Array.from_pandas(active_df[column], type=schema.field(column).type)
+        
+        names = ['postcode']
+        arrays = [column_array('postcode')]
+        for group, columns in self.ENHANCED_DATA_GROUPS.items():
+            names.append(group)
+            arrays.append(pa.StructArray.from_arrays([column_array(column) for column in columns], names=columns))
+        for column in ('incode', 'outcode'):
+            names.append(column)
+            arrays.append(column_array(column))
+        
+        pq.write_table(pa.Table.from_arrays(arrays, names=names), output_file, compression='zstd')
+        return len(active_df)
+    
+    def _iter_enhanced_records(self, active_df: pd.DataFrame) -> Tuple[int, Iterator[Tuple[str, Dict[str, Any]]]]:
+        """Return the postcode count and a stream of (postcode, nested entry) pairs
+        
+        Entries are unique per postcode (last one wins) and sorted by postcode,
+        with missing values as None.
+        """
+        active_df = active_df[active_df['postcode'].notna() & active_df['postcode'].ne('')]
+        active_df = active_df.drop_duplicates(subset='postcode', keep='last').sort_values('postcode')
+        
+        # Walk plain tuples in a fixed column order rather than building a Series per row
+        columns = ['postcode']
+        group_slices = []
+        for group, group_columns in self.ENHANCED_DATA_GROUPS.items():
+            group_slices.append((group, group_columns, len(columns), len(columns) + len(group_columns)))
+            columns.extend(group_columns)
+        columns.extend(['incode', 'outcode'])
+        
+        records = active_df[columns].astype(object)
+        records = records.where(records.notna(), None)
+        
+        def entries() -> Iterator[Tuple[str, Dict[str, Any]]]:
+            for record in records.itertuples(index=False, name=None):
+                entry = {group: dict(zip(group_columns, record[first:last]))
+                         for group, group_columns, first, last in group_slices}
+                entry['incode'], entry['outcode'] = record[-2:]
+                yield record[0], entry
+        
+        return len(records), entries()
+    
+    def _write_enhanced_python(self, active_df: pd.DataFrame, output_file: str) -> int:
+        """Write the enhanced dataset as an importable Python dict (legacy format)
+        
+        Entries are streamed to the file one line per postcode rather than
+        formatting the whole dict in memory first.
+        """
+        postcode_count, records = self._iter_enhanced_records(active_df)
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(f"# Enhanced UK Postcodes Dataset\n")
+            f.write(f"# Generated on {pd.Timestamp.now()}\n")
+            f.write(f"# Based on postcodes.io extraction logic (MIT License)\n")
+            f.write(f"# Total active postcodes: {postcode_count:,}\n")
+            f.write(f"# Source: ONS Postcode Directory\n\n")
+            f.write("ENHANCED_POSTCODE_DATA = {\n")
+            for postcode, entry in records:
+                f.write(f"    {postcode!r}: {entry!r},\n")
+            f.write("}\n")
+        
+        return postcode_count
+    
+    def _write_enhanced_json(self, active_df: pd.DataFrame, output_file: str) -> int:
+        """Write the enhanced dataset as a JSON object keyed by postcode
+        
+        Entries are serialized one at a time (with orjson when installed)
+        and streamed to the file.
+        """
+        postcode_count, records = self._iter_enhanced_records(active_df)
+        dumps = orjson.dumps if orjson is not None else (lambda value: json.dumps(value).encode('utf-8'))
+        
+        with open(output_file, 'wb') as f:
+            f.write(b"{\n")
+            for i, (postcode, entry) in enumerate(records):
+                if i:
+                    f.write(b",\n")
+                f.write(dumps(postcode) + b": " + dumps(entry))
+            f.write(b"\n}\n")
+        
+        return postcode_count
+
+# Per-process processor used by the ProcessPoolExecutor workers
+_worker_processor: Optional[ONSPDProcessor] = None
+
+def _init_worker(processor_class: type, data_dir: str):
+    """Load the schema and lookup tables once per worker process"""
+    global _worker_processor
+    _worker_processor = processor_class(data_dir=data_dir)
+
+def _process_csv_file_in_worker(csv_path: str, part_path: str, chunk_size: int) -> ProcessingStats:
+    """Worker task: process one CSV file into a Parquet part file"""
+    logger.info(f"Processing file: {Path(csv_path).name}")
+    return _worker_processor._process_csv_file_to_parquet(csv_path, part_path, chunk_size)
 
 def main():
     """Main entry point for command line usage"""
@@ -477,6 +916,7 @@ def main():
     parser.add_argument('--output', help='Output file path')
     parser.add_argument('--data-dir', default='../data', help='Data directory path')
     parser.add_argument('--chunk-size', type=int, default=50000, help='Chunk size for CSV processing')
+    parser.add_argument('--workers', type=int, help='Worker processes for CSV files (default: one per CPU)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     
     args = parser.parse_args()
@@ -488,7 +928,8 @@ def main():
         processor = ONSPDProcessor(data_dir=args.data_dir)
         output_file = processor.generate_enhanced_postcode_data(
             args.onspd_directory, 
-            args.output
+            args.output,
+            max_workers=args.workers
         )
         
         print(f"✅ Enhanced postcode data generated: {output_file}")
@@ -33,7 +33,8 @@ class PostcodeSQLiteCreator:
         """Create SQLite database with optimized schema"""
         conn = sqlite3.connect(db_path)
         conn.execute('PRAGMA journal_mode=WAL')  # Better concurrency
-        conn.execute('PRAGMA synchronous=NORMAL')  # Better performance
+        conn.execute('PRAGMA synchronous=OFF')  # A failed build is simply rerun
+        conn.execute('PRAGMA temp_store=MEMORY')
         conn.execute('PRAGMA cache_size=10000')  # 10MB cache
         
         # Drop existing tables
@@ -77,15 +78,20 @@ class PostcodeSQLiteCreator:
             value TEXT
         )''')
         
-        # Create indexes for fast lookups
+        conn.commit()
+        logger.info("Database schema created successfully")
+        return conn
+    
+    def create_indexes(self, conn):
+        """Create lookup indexes, once the data is loaded so each is built in a single pass"""
         indexes = [
             'CREATE INDEX idx_pc_compact ON postcodes(pc_compact)',
-            'CREATE INDEX idx_outcode ON postcodes(outcode)',
+            'CREATE INDEX idx_outcode ON postcodes(outcode, postcode)',
             'CREATE INDEX idx_incode ON postcodes(incode)', 
             'CREATE INDEX idx_location ON postcodes(latitude, longitude) WHERE latitude IS NOT NULL AND longitude IS NOT NULL',
-            'CREATE INDEX idx_country ON postcodes(country)',
-            'CREATE INDEX idx_district ON postcodes(district)',
-            'CREATE INDEX idx_constituency ON postcodes(constituency)',
+            'CREATE INDEX idx_country ON postcodes(country, postcode)',
+            'CREATE INDEX idx_district ON postcodes(district, postcode)',
+            'CREATE INDEX idx_constituency ON postcodes(constituency, postcode)',
             'CREATE INDEX idx_eastings_northings ON postcodes(eastings, northings) WHERE eastings IS NOT NULL AND northings IS NOT NULL'
         ]
         
@@ -93,8 +99,20 @@ class PostcodeSQLiteCreator:
             conn.execute(index_sql)
         
         conn.commit()
-        logger.info("Database schema created successfully")
-        return conn
+        logger.info("Indexes created successfully")
+    
+    def create_location_index(self, conn):
+        """Create the R*Tree that find_nearest uses to prefilter candidates by bounding box"""
+        conn.execute('DROP TABLE IF EXISTS postcodes_location')
+        conn.execute('CREATE VIRTUAL TABLE postcodes_location USING rtree(id, min_lat, max_lat, min_lon, max_lon)')
+        
+        # Built after loading so ids match final rowids (INSERT OR REPLACE reassigns them)
+        conn.execute('''
+        INSERT INTO postcodes_location
+        SELECT rowid, latitude, latitude, longitude, longitude FROM postcodes
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL''')
+        conn.commit()
+        logger.info("Location index created successfully")
     
     def _clean_value(self, value):
         """Clean pandas values and convert to proper Python types"""
@@ -119,14 +137,10 @@ class PostcodeSQLiteCreator:
             return value.item()
         return value
     
-    def _process_chunk_for_db(self, chunk: pd.DataFrame, csv_path: str = None) -> List[tuple]:
+    def _process_chunk_for_db(self, chunk: pd.DataFrame, csv_column_mapping: Dict[str, int] = None) -> List[tuple]:
         """Process chunk and return list of tuples for database insertion"""
-        # Get dynamic column mapping if CSV path provided
-        if csv_path:
-            csv_column_mapping = self.processor._get_csv_column_mapping(csv_path)
-            processed_chunk = self.processor._process_chunk(chunk, csv_column_mapping)
-        else:
-            processed_chunk = self.processor._process_chunk(chunk)
+        # Use the chunk's own column mapping if provided, otherwise the ONSPD schema
+        processed_chunk = self.processor._process_chunk(chunk, csv_column_mapping)
         
         if processed_chunk.empty:
             return []
@@ -210,13 +224,12 @@ class PostcodeSQLiteCreator:
                 
                 file_inserted = 0
                 
-                # Process CSV in chunks to manage memory
-                for chunk in pd.read_csv(str(csv_file), chunksize=10000, header=0, 
-                                       dtype=str, na_values=[''], keep_default_na=False,
-                                       encoding='utf-8', low_memory=False):
+                # Process CSV in chunks to manage memory, reading only the columns we need
+                reader, csv_column_mapping = self.processor._read_onspd_csv(str(csv_file), chunk_size=10000)
+                for chunk in reader:
                     
-                    # Process chunk and get rows for insertion (pass CSV path for dynamic mapping)
-                    rows_to_insert = self._process_chunk_for_db(chunk, str(csv_file))
+                    # Process chunk and get rows for insertion (pass column mapping for dynamic mapping)
+                    rows_to_insert = self._process_chunk_for_db(chunk, csv_column_mapping)
                     
                     if rows_to_insert:
                         # Insert in batches for better performance
@@ -234,6 +247,9 @@ class PostcodeSQLiteCreator:
             # Final commit
             conn.commit()
             
+            self.create_indexes(conn)
+            self.create_location_index(conn)
+            
             processing_time = time.time() - start_time
             
             # Add metadata
@@ -15,8 +15,11 @@ from uk_postcodes_parsing.ukpostcode import (
 try:
     from uk_postcodes_parsing.postcode_database import (
         lookup_postcode,
+        lookup_postcodes_batch,
         search_postcodes,
         find_nearest,
+        find_nearest_many,
+        find_nearest_to_postcode,
         get_area_postcodes,
         reverse_geocode,
         get_outcode_postcodes,
@@ -12,14 +12,30 @@ import lzma
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import hashlib
 import threading
 import time
+from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
 
+def database_file_signature(db_path: Path) -> Tuple[int, int, int, int]:
+    """(size, mtime) of a database file and its write-ahead log, if any
+
+    In WAL mode committed writes can sit in the -wal file without touching the
+    main file, so caches must key on both to notice changes.
+    """
+    stat = db_path.stat()
+    try:
+        wal_stat = db_path.with_name(db_path.name + "-wal").stat()
+        wal = (wal_stat.st_size, wal_stat.st_mtime_ns)
+    except FileNotFoundError:
+        wal = (0, 0)
+    return (stat.st_size, stat.st_mtime_ns) + wal
+
+
 class DatabaseManager:
     """Manages postcode database download and access with zero external dependencies"""
 
@@ -61,6 +77,7 @@ class DatabaseManager:
 
         self.download_url = "https://github.com/angangwa/uk-postcodes-parsing/releases/latest/download/postcodes.db.xz"
         self._download_lock = threading.Lock()
+        self._info_cache: Optional[Tuple[Tuple[int, int, int, int], dict]] = None
 
         # Check for auto-download environment variable
         self.auto_download = os.environ.get(
@@ -217,6 +234,7 @@ class DatabaseManager:
 
                 # Move decompressed file to final location
                 if temp_path.exists():
+                    self._release_open_database()
                     if self.db_path.exists():
                         self.db_path.unlink()  # Remove existing file
                     temp_path.rename(self.db_path)
@@ -291,12 +309,12 @@ class DatabaseManager:
             # Create indices for fast lookups
             indices = [
                 "CREATE INDEX IF NOT EXISTS idx_pc_compact ON postcodes(pc_compact)",
-                "CREATE INDEX IF NOT EXISTS idx_outcode ON postcodes(outcode)",
+                "CREATE INDEX IF NOT EXISTS idx_outcode ON postcodes(outcode, postcode)",
                 "CREATE INDEX IF NOT EXISTS idx_incode ON postcodes(incode)",
                 "CREATE INDEX IF NOT EXISTS idx_location ON postcodes(latitude, longitude) WHERE latitude IS NOT NULL AND longitude IS NOT NULL",
-                "CREATE INDEX IF NOT EXISTS idx_country ON postcodes(country)",
-                "CREATE INDEX IF NOT EXISTS idx_district ON postcodes(district)",
-                "CREATE INDEX IF NOT EXISTS idx_constituency ON postcodes(constituency)",
+                "CREATE INDEX IF NOT EXISTS idx_country ON postcodes(country, postcode)",
+                "CREATE INDEX IF NOT EXISTS idx_district ON postcodes(district, postcode)",
+                "CREATE INDEX IF NOT EXISTS idx_constituency ON postcodes(constituency, postcode)",
                 "CREATE INDEX IF NOT EXISTS idx_eastings_northings ON postcodes(eastings, northings) WHERE eastings IS NOT NULL AND northings IS NOT NULL",
             ]
 
@@ -350,7 +368,11 @@ class DatabaseManager:
             return {"exists": False, "is_local": self.is_local_db}
 
         try:
-            file_size = self.db_path.stat().st_size
+            signature = database_file_signature(self.db_path)
+            if self._info_cache is not None and self._info_cache[0] == signature:
+                return deepcopy(self._info_cache[1])
+
+            file_size = signature[0]
             file_size_mb = file_size / (1024 * 1024)
 
             conn = sqlite3.connect(str(self.db_path), timeout=5.0)
@@ -367,7 +389,7 @@ class DatabaseManager:
                 except sqlite3.OperationalError:
                     pass  # Metadata table doesn't exist
 
-                return {
+                info = {
                     "exists": True,
                     "path": str(self.db_path),
                     "size_mb": round(file_size_mb, 1),
@@ -376,6 +398,9 @@ class DatabaseManager:
                     "is_local": self.is_local_db,
                     "source": "local" if self.is_local_db else "downloaded",
                 }
+                # COUNT(*) scans the whole table; reuse it until the file changes
+                self._info_cache = (signature, info)
+                return deepcopy(info)
 
             finally:
                 conn.close()
@@ -383,9 +408,21 @@ class DatabaseManager:
         except Exception as e:
             return {"exists": True, "path": str(self.db_path), "error": str(e)}
 
+    def _release_open_database(self):
+        """Close the shared PostcodeDatabase before its file is replaced or removed
+
+        Otherwise its open connections keep serving the old file (and block
+        deleting it on Windows).
+        """
+        # Imported here because postcode_database imports this module
+        from .postcode_database import release_database
+
+        release_database()
+
     def remove_database(self):
         """Remove the database file (for testing or reset purposes)"""
         if self.db_path.exists():
+            self._release_open_database()
             self.db_path.unlink()
             logger.debug(f"Removed database: {self.db_path}")
 
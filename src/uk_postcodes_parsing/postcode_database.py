@@ -6,17 +6,22 @@ Uses connection-per-operation for maximum reliability and zero file locking issu
 import logging
 import math
 import sqlite3
+import sys
 import threading
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Literal
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Literal
 
-from .database_manager import ensure_database
+from .database_manager import database_file_signature, ensure_database
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PostcodeResult:
     """Result from postcode database lookup with comprehensive UK postcode data"""
 
@@ -46,7 +51,12 @@ class PostcodeResult:
     date_introduced: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary format"""
+        """Convert to dictionary format
+
+        The shape is fixed: every key and nested section is always present, so
+        callers can index it directly. Only ``coordinates`` may be None, when
+        the postcode has no latitude/longitude.
+        """
         coords = None
         if self.latitude and self.longitude:
             coords = {
@@ -117,33 +127,156 @@ class PostcodeResult:
         ):
             return None
 
-        # Haversine formula
-        lat1, lon1 = math.radians(self.latitude), math.radians(self.longitude)
-        lat2, lon2 = math.radians(other.latitude), math.radians(other.longitude)
-
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        # Haversine formula, squaring the half-angle sines by multiplication
+        lat1, lat2 = math.radians(self.latitude), math.radians(other.latitude)
+        sin_dlat = math.sin((lat2 - lat1) / 2)
+        sin_dlon = math.sin(math.radians(other.longitude - self.longitude) / 2)
 
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
+        a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
         c = 2 * math.asin(math.sqrt(a))
 
         return 6371.0 * c  # Earth's radius in km
 
 
+def _distance_sql(latitude: str, longitude: str) -> str:
+    """SQL for the great-circle distance in km from a search point to a row
+
+    Binds three parameters, in order: cos(search latitude), the search
+    longitude in radians and sin(search latitude). The cosine is clamped to
+    1.0 so rounding error can't make acos() return NULL at the exact search
+    coordinates.
+    """
+    return (
+        f"(6371 * acos(min(1.0, ? * cos(radians({latitude})) * "
+        f"cos(radians({longitude}) - ?) + ? * sin(radians({latitude})))))"
+    )
+
+
+def _valid_search_area(latitude: float, longitude: float, radius_km: float) -> bool:
+    """Whether a nearest-postcodes search could match anything
+
+    Out-of-range (or NaN) coordinates and negative radii never match a row,
+    so callers return early instead of querying the database.
+    """
+    return -90 <= latitude <= 90 and -180 <= longitude <= 180 and radius_km >= 0
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with prefix
+
+    None when there isn't one, i.e. the prefix is only U+10FFFF characters.
+    Skips the surrogate range, which can't be encoded for SQLite.
+    """
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    next_char = ord(prefix[-1]) + 1
+    if 0xD800 <= next_char <= 0xDFFF:
+        next_char = 0xE000
+    return prefix[:-1] + chr(next_char)
+
+
+# Nearest-postcode search using the optional postcodes_location R*Tree. It finds
+# bounding-box candidates without scanning the whole latitude band; its
+# coordinates are float32, so approximate distances are within the slack of the
+# exact ones. A postcode more than twice the slack beyond the limit-th closest
+# approximate distance can't be among the nearest, so only candidates up to that
+# cutoff have exact distances computed before the final filter and limit.
+_NEAREST_INDEXED_SQL = f"""
+    WITH approximate AS (
+        SELECT id, distance FROM (
+            SELECT id, {_distance_sql("(min_lat + max_lat) / 2", "(min_lon + max_lon) / 2")} AS distance
+            FROM postcodes_location
+            WHERE min_lat >= ? AND max_lat <= ?
+            AND min_lon >= ? AND max_lon <= ?
+        )
+        WHERE distance <= ?
+    ),
+    cutoff AS (
+        SELECT distance + ? AS distance FROM approximate
+        ORDER BY distance
+        LIMIT 1 OFFSET ?
+    ),
+    candidates AS (
+        SELECT id FROM approximate
+        WHERE distance <= coalesce((SELECT distance FROM cutoff), ?)
+    )
+    SELECT * FROM (
+        SELECT postcodes.*, {_distance_sql("latitude", "longitude")} AS distance
+        FROM candidates JOIN postcodes ON postcodes.rowid = candidates.id
+    )
+    WHERE distance <= ?
+    ORDER BY distance
+    LIMIT ?
+"""
+
+# Fallback without the R*Tree: rank candidates on (rowid, distance) only, which
+# idx_location covers, and fetch full rows just for the top `limit` results
+_NEAREST_SCAN_SQL = f"""
+    WITH nearest AS (
+        SELECT id, distance FROM (
+            SELECT rowid AS id, {_distance_sql("latitude", "longitude")} AS distance
+            FROM postcodes
+            WHERE latitude BETWEEN ? AND ?
+            AND longitude BETWEEN ? AND ?
+            AND latitude IS NOT NULL
+            AND longitude IS NOT NULL
+        )
+        WHERE distance <= ?
+        ORDER BY distance
+        LIMIT ?
+    )
+    SELECT postcodes.*, nearest.distance
+    FROM nearest JOIN postcodes ON postcodes.rowid = nearest.id
+    ORDER BY nearest.distance
+"""
+
+# Column names that map directly onto PostcodeResult fields
+_RESULT_FIELDS = tuple(field.name for field in fields(PostcodeResult))
+_result_values = attrgetter(*_RESULT_FIELDS)
+
+
+def _copy_result(result: Optional[PostcodeResult]) -> Optional[PostcodeResult]:
+    """Copy of a cached result, so a caller changing it can't affect later lookups"""
+    if result is None:
+        return None
+    return PostcodeResult(*_result_values(result))
+
+
 class PostcodeDatabase:
     """Simple, reliable SQLite database interface using connection-per-operation pattern"""
 
+    # Maximum entries kept in the in-memory LRU caches
+    LOOKUP_CACHE_SIZE = 4096
+    OUTCODE_CACHE_SIZE = 256
+
+    # Stay under SQLite's default limit on bound parameters per statement
+    MAX_QUERY_PARAMS = 900
+
+    # Rows fetched per batch when streaming results
+    STREAM_BATCH_SIZE = 1000
+
+    # Extra radius when ranking on the R*Tree's float32 coordinates (~0.5m error)
+    LOCATION_INDEX_SLACK_KM = 0.001
+
+    # Bytes of the file reused connections read through mmap instead of read()
+    MMAP_SIZE = 1024 * 1024 * 1024
+
     def __init__(
-        self, db_path: Optional[str] = None, local_db_path: Optional[str] = None
+        self,
+        db_path: Optional[str] = None,
+        local_db_path: Optional[str] = None,
+        reuse_connections: bool = False,
     ):
         """Initialize database path
 
         Args:
             db_path: Direct path to database file (deprecated, use local_db_path instead)
             local_db_path: Path to locally-built database file to use
+            reuse_connections: Keep one open connection per thread instead of
+                connecting for every operation. Much faster for many small
+                queries, but the database file stays open until close() is
+                called, which blocks deleting or replacing it on Windows.
         """
         if db_path is None:
             # Use database manager (supports local_db_path)
@@ -153,67 +286,181 @@ class PostcodeDatabase:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Postcode database not found at {self.db_path}")
 
-        # Cache for frequently accessed data
-        self._outcode_cache = {}
+        # Bounded LRU caches for frequently accessed data
+        self._lookup_cache: "OrderedDict[str, Optional[PostcodeResult]]" = OrderedDict()
+        self._outcode_cache: "OrderedDict[str, List[PostcodeResult]]" = OrderedDict()
         self._cache_lock = threading.Lock()
 
-    def _execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
-        """Execute query with connection-per-operation pattern"""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
-        conn.row_factory = sqlite3.Row
+        # Whether the optional postcodes_location R*Tree exists (checked lazily)
+        self._location_index: Optional[bool] = None
+
+        # get_statistics result, keyed by database_file_signature()
+        self._statistics: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
+        # Per-thread connections, only used when reuse_connections is enabled.
+        # close() bumps the generation so threads drop their closed connection.
+        self.reuse_connections = reuse_connections
+        self._thread_local = threading.local()
+        self._open_connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connection_generation = 0
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) from an LRU cache, marking the entry as recently used"""
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return True, cache[key]
+        return False, None
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any, max_size: int):
+        """Store a value in an LRU cache, evicting the least recently used entries"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached lookup and outcode results (e.g. after replacing the database)"""
+        with self._cache_lock:
+            self._lookup_cache.clear()
+            self._outcode_cache.clear()
+        self._statistics = None
+
+    def _has_location_index(self) -> bool:
+        """Check once whether the database has the postcodes_location R*Tree"""
+        if self._location_index is None:
+            try:
+                self._execute_query_one("SELECT 1 FROM postcodes_location LIMIT 1")
+                self._location_index = True
+            except sqlite3.Error:
+                # Table missing, or SQLite built without the rtree module
+                self._location_index = False
+        return self._location_index
+
+    def create_location_index(self):
+        """Build the optional postcodes_location R*Tree used by find_nearest
+
+        Databases from the ONSPD builder already include it. For others, such as
+        the downloaded database, this is a one-off step: it takes tens of seconds
+        on the full dataset and adds roughly 65 bytes per postcode to the file.
+        """
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
         try:
-            cursor = conn.execute(query, params)
-            return cursor.fetchall()
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS postcodes_location "
+                "USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+            )
+            conn.execute("DELETE FROM postcodes_location")
+            conn.execute(
+                "INSERT INTO postcodes_location "
+                "SELECT rowid, latitude, latitude, longitude, longitude FROM postcodes "
+                "WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+            )
+            conn.commit()
         finally:
             conn.close()
+        self._location_index = True
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection to the database"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=10.0,
+            check_same_thread=not self.reuse_connections,
+        )
+        conn.row_factory = sqlite3.Row
+        if self.reuse_connections:
+            # Setting up the mapping costs more than it saves on a connection
+            # that serves a single query, so only long-lived ones use it
+            conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection for a single operation
+
+        By default a new connection is opened and closed afterwards. With
+        reuse_connections, the calling thread's connection is kept open.
+        """
+        if not self.reuse_connections:
+            conn = self._connect()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        local = self._thread_local
+        if getattr(local, "generation", None) != self._connection_generation:
+            conn = self._connect()
+            with self._cache_lock:
+                # Threads that have exited never use their connection again, so
+                # close those rather than keeping one open per past thread
+                stale = [c for t, c in self._open_connections if not t.is_alive()]
+                self._open_connections = [
+                    (t, c) for t, c in self._open_connections if t.is_alive()
+                ]
+                self._open_connections.append((threading.current_thread(), conn))
+                local.generation = self._connection_generation
+            for stale_conn in stale:
+                stale_conn.close()
+            local.conn = conn
+        yield local.conn
+
+    def _execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Execute query and return all rows"""
+        with self._connection() as conn:
+            return conn.execute(query, params).fetchall()
 
     def _execute_query_one(
         self, query: str, params: tuple = ()
     ) -> Optional[sqlite3.Row]:
         """Execute query and return single result"""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
-        conn.row_factory = sqlite3.Row
+        with self._connection() as conn:
+            return conn.execute(query, params).fetchone()
+
+    def _iter_results(self, query: str, params: tuple = ()) -> Iterator[PostcodeResult]:
+        """Execute query and yield results as rows are fetched, in batches"""
+        # Streams are long-lived, so they always use a dedicated connection
+        conn = self._connect()
         try:
             cursor = conn.execute(query, params)
-            return cursor.fetchone()
+            columns = None
+            while True:
+                rows = cursor.fetchmany(self.STREAM_BATCH_SIZE)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = self._result_columns(rows[0])
+                for row in rows:
+                    yield self._row_to_result(row, columns)
         finally:
             conn.close()
 
-    def _row_to_result(self, row: sqlite3.Row) -> PostcodeResult:
-        """Convert SQLite row to PostcodeResult"""
+    def _result_columns(self, row: sqlite3.Row) -> Tuple[str, ...]:
+        """PostcodeResult fields available in a query's result columns"""
+        keys = set(row.keys())
+        return tuple(name for name in _RESULT_FIELDS if name in keys)
 
-        def safe_get(row, key, default=None):
-            try:
-                return row[key]
-            except (KeyError, IndexError):
-                return default
-
-        return PostcodeResult(
-            postcode=row["postcode"],
-            incode=row["incode"],
-            outcode=row["outcode"],
-            latitude=row["latitude"],
-            longitude=row["longitude"],
-            eastings=row["eastings"],
-            northings=row["northings"],
-            country=row["country"],
-            region=row["region"],
-            county=safe_get(row, "county"),
-            district=row["district"],
-            ward=safe_get(row, "ward"),
-            parish=safe_get(row, "parish"),
-            constituency=safe_get(row, "constituency"),
-            healthcare_region=safe_get(row, "healthcare_region"),
-            nhs_health_authority=safe_get(row, "nhs_health_authority"),
-            primary_care_trust=safe_get(row, "primary_care_trust"),
-            lower_output_area=safe_get(row, "lower_output_area"),
-            middle_output_area=safe_get(row, "middle_output_area"),
-            statistical_region=safe_get(row, "statistical_region"),
-            police_force=safe_get(row, "police_force"),
-            county_division=safe_get(row, "county_division"),
-            coordinate_quality=safe_get(row, "coordinate_quality"),
-            date_introduced=safe_get(row, "date_introduced"),
-        )
+    def _row_to_result(
+        self, row: sqlite3.Row, columns: Optional[Tuple[str, ...]] = None
+    ) -> PostcodeResult:
+        """Convert SQLite row to PostcodeResult
+
+        Fields missing from the row keep their dataclass defaults. Pass the
+        precomputed ``columns`` when converting many rows from one query.
+        """
+        if columns is None:
+            columns = self._result_columns(row)
+        return PostcodeResult(**{name: row[name] for name in columns})
+
+    def _rows_to_results(self, rows: List[sqlite3.Row]) -> List[PostcodeResult]:
+        """Convert rows from a single query, resolving the column set once"""
+        if not rows:
+            return []
+        columns = self._result_columns(rows[0])
+        return [self._row_to_result(row, columns) for row in rows]
 
     def lookup(self, postcode: str) -> Optional[PostcodeResult]:
         """Look up a single postcode"""
@@ -223,12 +470,68 @@ class PostcodeDatabase:
         postcode = postcode.upper().strip()
         pc_compact = postcode.replace(" ", "")
 
+        # Cache by compact form so "sw1a 1aa" and "SW1A1AA" share an entry
+        hit, result = self._cache_get(self._lookup_cache, pc_compact)
+        if hit:
+            return _copy_result(result)
+
         row = self._execute_query_one(
             "SELECT * FROM postcodes WHERE postcode = ? OR pc_compact = ?",
             (postcode, pc_compact),
         )
 
-        return self._row_to_result(row) if row else None
+        result = self._row_to_result(row) if row else None
+        self._cache_put(self._lookup_cache, pc_compact, result, self.LOOKUP_CACHE_SIZE)
+        return _copy_result(result)
+
+    def lookup_batch(self, postcodes: List[str]) -> Dict[str, Optional[PostcodeResult]]:
+        """Look up many postcodes with one query per chunk instead of one per postcode
+
+        Returns a dict keyed by each input postcode (None where not found).
+        """
+        results: Dict[str, Optional[PostcodeResult]] = {}
+        pending: Dict[str, Tuple[str, List[str]]] = {}
+
+        for original in postcodes:
+            if not original or original in results:
+                results.setdefault(original, None)
+                continue
+            postcode = original.upper().strip()
+            pc_compact = postcode.replace(" ", "")
+            hit, result = self._cache_get(self._lookup_cache, pc_compact)
+            results[original] = _copy_result(result)
+            if not hit:
+                pending.setdefault(pc_compact, (postcode, []))[1].append(original)
+
+        # Each pending postcode binds two parameters (postcode and pc_compact)
+        pc_compacts = list(pending)
+        chunk_size = self.MAX_QUERY_PARAMS // 2
+        for start in range(0, len(pc_compacts), chunk_size):
+            chunk = pc_compacts[start : start + chunk_size]
+            # Pad to a power of two by repeating the last code, so batches share
+            # a few cached prepared statements instead of preparing one per size
+            size = min(1 << (len(chunk) - 1).bit_length(), chunk_size)
+            padded = chunk + chunk[-1:] * (size - len(chunk))
+            placeholders = ",".join("?" * size)
+            rows = self._execute_query(
+                f"SELECT * FROM postcodes WHERE postcode IN ({placeholders}) "
+                f"OR pc_compact IN ({placeholders})",
+                tuple(pending[pc][0] for pc in padded) + tuple(padded),
+            )
+            found = {
+                (row["pc_compact"] or row["postcode"].replace(" ", "")): result
+                for row, result in zip(rows, self._rows_to_results(rows))
+            }
+
+            for pc_compact in chunk:
+                result = found.get(pc_compact)
+                self._cache_put(
+                    self._lookup_cache, pc_compact, result, self.LOOKUP_CACHE_SIZE
+                )
+                for original in pending[pc_compact][1]:
+                    results[original] = _copy_result(result)
+
+        return results
 
     def search(self, query: str, limit: int = 10) -> List[PostcodeResult]:
         """Search for postcodes matching query (prefix search)"""
@@ -236,74 +539,103 @@ class PostcodeDatabase:
             return []
 
         query = query.upper().strip()
-        query_pattern = f"{query}%"
+        if not query:
+            return []
 
-        rows = self._execute_query(
-            "SELECT * FROM postcodes WHERE postcode LIKE ? ORDER BY postcode LIMIT ?",
-            (query_pattern, limit),
+        # A range on the primary key instead of LIKE, which is case-insensitive
+        # and so can't use the BINARY index: the search reads only the matches
+        upper_bound = _prefix_upper_bound(query)
+        if upper_bound is None:
+            rows = self._execute_query(
+                "SELECT * FROM postcodes WHERE postcode >= ? ORDER BY postcode LIMIT ?",
+                (query, limit),
+            )
+        else:
+            rows = self._execute_query(
+                "SELECT * FROM postcodes WHERE postcode >= ? AND postcode < ? "
+                "ORDER BY postcode LIMIT ?",
+                (query, upper_bound, limit),
+            )
+
+        return self._rows_to_results(rows)
+
+    def _nearest_query(
+        self, latitude: float, longitude: float, radius_km: float, limit: int
+    ) -> Tuple[str, tuple]:
+        """Build the query and parameters for a nearest-postcodes search"""
+        # Rough bounding box for efficiency
+        lat_delta = radius_km / 111.0
+        lon_delta = radius_km / (111.0 * math.cos(math.radians(latitude)))
+        bbox = (
+            latitude - lat_delta,
+            latitude + lat_delta,
+            longitude - lon_delta,
+            longitude + lon_delta,
         )
 
-        return [self._row_to_result(row) for row in rows]
+        # Trig terms for the search point are constant across rows, so compute
+        # them once here instead of per candidate inside SQLite
+        lat_rad = math.radians(latitude)
+        point = (math.cos(lat_rad), math.radians(longitude), math.sin(lat_rad))
+
+        if self._has_location_index():
+            slack = self.LOCATION_INDEX_SLACK_KM
+            return _NEAREST_INDEXED_SQL, (
+                point
+                + bbox
+                + (radius_km + slack, 2 * slack, max(limit, 1) - 1, radius_km + slack)
+                + point
+                + (radius_km, limit)
+            )
+        return _NEAREST_SCAN_SQL, point + bbox + (radius_km, limit)
+
+    def _nearest_results(
+        self, rows: List[sqlite3.Row]
+    ) -> List[Tuple[PostcodeResult, float]]:
+        """Pair each nearest-search row's PostcodeResult with its distance"""
+        return [
+            (result, row["distance"])
+            for result, row in zip(self._rows_to_results(rows), rows)
+        ]
 
     def find_nearest(
         self, latitude: float, longitude: float, radius_km: float = 10, limit: int = 10
     ) -> List[Tuple[PostcodeResult, float]]:
         """Find nearest postcodes within radius"""
-        # Rough bounding box for efficiency
-        lat_delta = radius_km / 111.0
-        lon_delta = radius_km / (111.0 * math.cos(math.radians(latitude)))
-
+        if not _valid_search_area(latitude, longitude, radius_km):
+            return []
         rows = self._execute_query(
-            """
-            SELECT *, distance FROM (
-                SELECT *,
-                       (6371 * acos(cos(radians(?)) * cos(radians(latitude)) * 
-                       cos(radians(longitude) - radians(?)) + 
-                       sin(radians(?)) * sin(radians(latitude)))) AS distance
-                FROM postcodes 
-                WHERE latitude BETWEEN ? AND ? 
-                AND longitude BETWEEN ? AND ?
-                AND latitude IS NOT NULL 
-                AND longitude IS NOT NULL
-            ) WHERE distance <= ? 
-            ORDER BY distance 
-            LIMIT ?
-            """,
-            (
-                latitude,
-                longitude,
-                latitude,
-                latitude - lat_delta,
-                latitude + lat_delta,
-                longitude - lon_delta,
-                longitude + lon_delta,
-                radius_km,
-                limit,
-            ),
+            *self._nearest_query(latitude, longitude, radius_km, limit)
         )
+        return self._nearest_results(rows)
 
+    def find_nearest_many(
+        self,
+        points: List[Tuple[float, float]],
+        radius_km: float = 10,
+        limit: int = 10,
+    ) -> List[List[Tuple[PostcodeResult, float]]]:
+        """Find nearest postcodes for many (latitude, longitude) points at once
+
+        Runs every search on one connection, so batches avoid the per-query
+        connection overhead. Results are aligned with the input points.
+        """
         results = []
-        for row in rows:
-            postcode_result = self._row_to_result(row)
-            distance = row["distance"]
-            results.append((postcode_result, distance))
-
+        with self._connection() as conn:
+            for latitude, longitude in points:
+                if not _valid_search_area(latitude, longitude, radius_km):
+                    results.append([])
+                    continue
+                rows = conn.execute(
+                    *self._nearest_query(latitude, longitude, radius_km, limit)
+                ).fetchall()
+                results.append(self._nearest_results(rows))
         return results
 
-    def get_area_postcodes(
-        self,
-        area_type: Literal[
-            "country",
-            "region",
-            "district",
-            "county",
-            "constituency",
-            "healthcare_region",
-        ],
-        area_value: str,
-        limit: Optional[int] = None,
-    ) -> List[PostcodeResult]:
-        """Get postcodes in a specific administrative area"""
+    def _area_query(
+        self, area_type: str, area_value: str, limit: Optional[int]
+    ) -> Tuple[str, tuple]:
+        """Build the query and parameters for an administrative area lookup"""
         area_mappings = {
             "country": "country",
             "region": "region",
@@ -326,8 +658,44 @@ class PostcodeDatabase:
             query += " LIMIT ?"
             params.append(limit)
 
-        rows = self._execute_query(query, tuple(params))
-        return [self._row_to_result(row) for row in rows]
+        return query, tuple(params)
+
+    def get_area_postcodes(
+        self,
+        area_type: Literal[
+            "country",
+            "region",
+            "district",
+            "county",
+            "constituency",
+            "healthcare_region",
+        ],
+        area_value: str,
+        limit: Optional[int] = None,
+    ) -> List[PostcodeResult]:
+        """Get postcodes in a specific administrative area"""
+        rows = self._execute_query(*self._area_query(area_type, area_value, limit))
+        return self._rows_to_results(rows)
+
+    def iter_area_postcodes(
+        self,
+        area_type: Literal[
+            "country",
+            "region",
+            "district",
+            "county",
+            "constituency",
+            "healthcare_region",
+        ],
+        area_value: str,
+        limit: Optional[int] = None,
+    ) -> Iterator[PostcodeResult]:
+        """Stream postcodes in an administrative area without building the full list
+
+        Suited to large areas such as a whole country. The database connection
+        stays open until the iterator is exhausted or closed.
+        """
+        return self._iter_results(*self._area_query(area_type, area_value, limit))
 
     def get_outcode_postcodes(self, outcode: str) -> List[PostcodeResult]:
         """Get all postcodes in an outcode area"""
@@ -337,21 +705,20 @@ class PostcodeDatabase:
         outcode = outcode.upper().strip()
 
         # Check cache first
-        with self._cache_lock:
-            if outcode in self._outcode_cache:
-                return self._outcode_cache[outcode]
+        hit, results = self._cache_get(self._outcode_cache, outcode)
+        if hit:
+            return [_copy_result(result) for result in results]
 
         rows = self._execute_query(
             "SELECT * FROM postcodes WHERE outcode = ? ORDER BY postcode", (outcode,)
         )
 
-        results = [self._row_to_result(row) for row in rows]
+        results = self._rows_to_results(rows)
 
         # Cache result
-        with self._cache_lock:
-            self._outcode_cache[outcode] = results
+        self._cache_put(self._outcode_cache, outcode, results, self.OUTCODE_CACHE_SIZE)
 
-        return results
+        return [_copy_result(result) for result in results]
 
     def reverse_geocode(
         self, latitude: float, longitude: float
@@ -362,8 +729,27 @@ class PostcodeDatabase:
             return results[0][0]  # Return just the PostcodeResult
         return None
 
+    def find_nearest_to_postcode(
+        self, postcode: str, radius_km: float = 10, limit: int = 10
+    ) -> List[Tuple[PostcodeResult, float]]:
+        """Find nearest postcodes to a postcode (including itself, at distance 0)
+
+        The postcode's coordinates come from the lookup cache when possible, so
+        repeated searches around the same postcode run a single query.
+        """
+        result = self.lookup(postcode)
+        if result is None or result.latitude is None or result.longitude is None:
+            return []
+        return self.find_nearest(result.latitude, result.longitude, radius_km, limit)
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get database statistics"""
+        """Get database statistics (cached until the database file changes)"""
+        # The counts scan the whole table, so reuse them while the file is unchanged
+        signature = database_file_signature(self.db_path)
+        cached = self._statistics
+        if cached is not None and cached[0] == signature:
+            return deepcopy(cached[1])
+
         total_row = self._execute_query_one("SELECT COUNT(*) as total FROM postcodes")
         total = total_row["total"] if total_row else 0
 
@@ -382,18 +768,27 @@ class PostcodeDatabase:
 
         coverage_percent = (with_coords / total * 100) if total > 0 else 0
 
-        return {
+        stats = {
             "total_postcodes": total,
             "with_coordinates": with_coords,
             "coordinate_coverage_percent": round(coverage_percent, 1),
             "countries": countries,
             "database_path": str(self.db_path),
-            "database_size_mb": round(self.db_path.stat().st_size / (1024 * 1024), 1),
+            "database_size_mb": round(signature[0] / (1024 * 1024), 1),
         }
+        self._statistics = (signature, stats)
+        return deepcopy(stats)
 
     def close(self):
-        """No-op - connections are closed after each operation"""
-        pass
+        """Close connections kept open by reuse_connections
+
+        A no-op by default, since connections are closed after each operation.
+        """
+        with self._cache_lock:
+            connections, self._open_connections = self._open_connections, []
+            self._connection_generation += 1
+        for _, conn in connections:
+            conn.close()
 
 
 # Global database instance (lazy-loaded)
@@ -414,7 +809,10 @@ def get_database(
 
     with _db_lock:
         if _db_instance is None:
-            _db_instance = PostcodeDatabase(db_path, local_db_path)
+            # Shared by every caller, so keep one connection open per thread
+            _db_instance = PostcodeDatabase(
+                db_path, local_db_path, reuse_connections=True
+            )
         elif local_db_path:
             # Check if trying to use different local database
             current_path = str(_db_instance.db_path)
@@ -426,6 +824,23 @@ def get_database(
     return _db_instance
 
 
+def release_database():
+    """Close and drop the global database instance
+
+    Called before the database file is replaced or removed, since the shared
+    instance keeps connections open to it and caches its results. The next
+    get_database() call opens the file afresh.
+    """
+    global _db_instance
+
+    with _db_lock:
+        instance, _db_instance = _db_instance, None
+    if instance is not None:
+        # Callers may still hold the old instance, so don't leave it stale
+        instance.close()
+        instance.clear_cache()
+
+
 # API functions for convenience
 def lookup_postcode(postcode: str) -> Optional[PostcodeResult]:
     """Look up a single postcode using global database instance"""
@@ -439,6 +854,18 @@ def lookup_postcode(postcode: str) -> Optional[PostcodeResult]:
         return None
 
 
+def lookup_postcodes_batch(postcodes: List[str]) -> Dict[str, Optional[PostcodeResult]]:
+    """Look up many postcodes at once using global database instance"""
+    try:
+        return get_database().lookup_batch(postcodes)
+    except RuntimeError as e:
+        if "UK Postcodes database required" in str(e):
+            raise e  # Re-raise helpful database setup error
+        return {postcode: None for postcode in postcodes}
+    except Exception:
+        return {postcode: None for postcode in postcodes}
+
+
 def search_postcodes(query: str, limit: int = 10) -> List[PostcodeResult]:
     """Search for postcodes using global database instance"""
     try:
@@ -465,6 +892,34 @@ def find_nearest(
         return []
 
 
+def find_nearest_many(
+    points: List[Tuple[float, float]], radius_km: float = 10, limit: int = 10
+) -> List[List[Tuple[PostcodeResult, float]]]:
+    """Find nearest postcodes for many points using global database instance"""
+    try:
+        return get_database().find_nearest_many(points, radius_km, limit)
+    except RuntimeError as e:
+        if "UK Postcodes database required" in str(e):
+            raise e  # Re-raise helpful database setup error
+        return [[] for _ in points]
+    except Exception:
+        return [[] for _ in points]
+
+
+def find_nearest_to_postcode(
+    postcode: str, radius_km: float = 10, limit: int = 10
+) -> List[Tuple[PostcodeResult, float]]:
+    """Find nearest postcodes to a postcode using global database instance"""
+    try:
+        return get_database().find_nearest_to_postcode(postcode, radius_km, limit)
+    except RuntimeError as e:
+        if "UK Postcodes database required" in str(e):
+            raise e  # Re-raise helpful database setup error
+        return []
+    except Exception:
+        return []
+
+
 def reverse_geocode(latitude: float, longitude: float) -> Optional[PostcodeResult]:
     """Find closest postcode to coordinates using global database instance"""
     try:
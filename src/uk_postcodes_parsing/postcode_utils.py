@@ -44,7 +44,7 @@ def is_valid(postcode: str) -> bool:
     Returns:
         bool: True if the postcode is valid, False otherwise
     """
-    return re.match(POSTCODE_REGEX, postcode) is not None
+    return POSTCODE_REGEX.match(postcode) is not None
 
 
 def is_valid_outcode(outcode: str) -> bool:
@@ -55,7 +55,7 @@ def is_valid_outcode(outcode: str) -> bool:
     Returns:
         bool: True if the postcode is valid, False otherwise
     """
-    return re.match(OUTCODE_REGEX, outcode) is not None
+    return OUTCODE_REGEX.match(outcode) is not None
 
 
 def to_normalised(postcode: str) -> Union[str, None]:
@@ -82,7 +82,7 @@ def to_outcode(postcode: str) -> Union[str, None]:
     """
     if not is_valid(postcode):
         return None
-    return re.sub(INCODE_REGEX, "", sanitize(postcode))
+    return INCODE_REGEX.sub("", sanitize(postcode))
 
 
 def to_incode(postcode: str) -> Union[str, None]:
@@ -94,7 +94,7 @@ def to_incode(postcode: str) -> Union[str, None]:
     """
     if not is_valid(postcode):
         return None
-    incode = re.findall(INCODE_REGEX, sanitize(postcode))
+    incode = INCODE_REGEX.findall(sanitize(postcode))
     return incode[0] if incode else None
 
 
@@ -107,7 +107,7 @@ def to_area(postcode: str) -> Union[str, None]:
     """
     if not is_valid(postcode):
         return None
-    area = re.findall(AREA_REGEX, sanitize(postcode))
+    area = AREA_REGEX.findall(sanitize(postcode))
     return area[0] if area else None
 
 
@@ -134,7 +134,7 @@ def to_unit(postcode: str) -> Union[str, None]:
     """
     if not is_valid(postcode):
         return None
-    unit = re.findall(UNIT_REGEX, sanitize(postcode))
+    unit = UNIT_REGEX.findall(sanitize(postcode))
     return unit[0] if unit else None
 
 
@@ -148,7 +148,7 @@ def to_district(postcode: str) -> Union[str, None]:
     outcode = to_outcode(postcode)
     if outcode is None:
         return None
-    district = re.match(DISTRICT_SPLIT_REGEX, outcode)
+    district = DISTRICT_SPLIT_REGEX.match(outcode)
     return district[1] if district else outcode
 
 
@@ -162,5 +162,5 @@ def to_sub_district(postcode: str) -> Union[str, None]:
     outcode = to_outcode(postcode)
     if outcode is None:
         return None
-    split = re.match(DISTRICT_SPLIT_REGEX, outcode)
+    split = DISTRICT_SPLIT_REGEX.match(outcode)
     return None if split is None else outcode
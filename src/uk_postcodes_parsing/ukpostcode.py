@@ -2,30 +2,40 @@
 ukpostcode.py: main module for parsing UK postcodes from text.
 """
 
+import importlib
 import re
 import logging
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Union, List, Optional
+from functools import lru_cache
+from operator import ne
+from typing import Union, List, Optional, Set
 
 from uk_postcodes_parsing.postcode_utils import (
+    AREA_REGEX,
+    DISTRICT_SPLIT_REGEX,
+    INCODE_REGEX,
     is_valid,
-    to_normalised,
+    sanitize,
     to_outcode,
     to_incode,
-    to_area,
-    to_sector,
-    to_unit,
-    to_district,
-    to_sub_district,
 )
 from uk_postcodes_parsing.fix import fix, fix_with_options
 
 logger = logging.getLogger(__name__)
 
+# Letters spelled out rather than using re.I, which slows the scan at every
+# position of the corpus. The non-ASCII ones (İ, ı, ſ, K) are those re.I would
+# also fold onto a-z, so the patterns match exactly the same text.
+_LETTERS = "A-Za-z\u0130\u0131\u017f\u212a"
+_DIGITS_OR_OI = "0-9OoIi\u0130\u0131"
+
 # Test for a valid postcode embedded in text
-POSTCODE_CORPUS_REGEX = re.compile(r"[a-z]{1,2}\d[a-z\d]?\s*\d[a-z]{2}", re.I)
+POSTCODE_CORPUS_REGEX = re.compile(
+    rf"[{_LETTERS}]{{1,2}}\d[{_LETTERS}\d]?\s*\d[{_LETTERS}]{{2}}"
+)
 FIXABLE_POSTCODE_CORPUS_REGEX = re.compile(
-    r"[a-z01]{1,2}[0-9oi][a-z\d]?\s*[0-9oi][a-z01]{2}", re.I
+    rf"[{_LETTERS}01]{{1,2}}[{_DIGITS_OR_OI}][{_LETTERS}\d]?\s*[{_DIGITS_OR_OI}][{_LETTERS}01]{{2}}"
 )
 
 SPECIAL_CASE_POSTCODES = ("GIR", "NPT", "BX", "BF")
@@ -78,10 +88,10 @@ class Postcode:
         outward = original[:-3].strip()
         formatted = f"{outward} {inward}"
 
-        fix_distance = sum(c1 != c2 for c1, c2 in zip(formatted, self.postcode)) * -1
-
-        self.fix_distance = fix_distance
-        self.is_in_ons_postcode_directory = is_in_ons_postcode_directory(self.postcode)
+        # Count differing characters with map(ne) rather than a generator expression
+        self.fix_distance = -sum(map(ne, formatted, self.postcode))
+        # outcode/incode are already parsed, so skip re-deriving them from postcode
+        self.is_in_ons_postcode_directory = _in_ons_directory(self.outcode, self.incode)
 
     def __eq__(self, other):
         """Ignore is_in_ons_postcode_directory and fix_distance."""
@@ -108,15 +118,21 @@ def _parse(postcode: str) -> dict:
     """
     if not is_valid(postcode):
         return None
+    # Validate once and derive every part from the sanitized string, rather than
+    # re-validating inside each of the `to_*` helpers
+    sanitized = sanitize(postcode)
+    outcode = INCODE_REGEX.sub("", sanitized)
+    incode = INCODE_REGEX.search(sanitized)[0]
+    district_split = DISTRICT_SPLIT_REGEX.match(outcode)
     return {
-        "postcode": to_normalised(postcode),
-        "incode": to_incode(postcode),
-        "outcode": to_outcode(postcode),
-        "area": to_area(postcode),
-        "district": to_district(postcode),
-        "sub_district": to_sub_district(postcode),
-        "sector": to_sector(postcode),
-        "unit": to_unit(postcode),
+        "postcode": f"{outcode} {incode}",
+        "incode": incode,
+        "outcode": outcode,
+        "area": AREA_REGEX.match(sanitized)[0],
+        "district": district_split[1] if district_split else outcode,
+        "sub_district": outcode if district_split else None,
+        "sector": f"{outcode} {incode[0]}",
+        "unit": incode[1:],
     }
 
 
@@ -184,22 +200,48 @@ def parse_from_corpus(
     if try_all_fix_options and not attempt_fix:
         raise ValueError("attempt_fix must be true if try_all_fix_options is True")
 
+    # Matches repeat often in real documents, so each distinct match is parsed
+    # once and every occurrence gets its own copy of the result
     if attempt_fix:
-        postcodes = re.findall(FIXABLE_POSTCODE_CORPUS_REGEX, text)
+        postcodes = FIXABLE_POSTCODE_CORPUS_REGEX.findall(text)
         if try_all_fix_options:
-            postcodes = [parse_all_options(postcode) for postcode in postcodes]
-            postcodes = [item for sublist in postcodes for item in sublist]  # Flatten
+            parsed = {pc: parse_all_options(pc) for pc in dict.fromkeys(postcodes)}
+            postcodes = [copy(item) for pc in postcodes for item in parsed[pc]]
         else:
-            postcodes = [parse(postcode, attempt_fix=True) for postcode in postcodes]
-            postcodes = [postcode for postcode in postcodes if postcode is not None]
+            parsed = {
+                pc: parse(pc, attempt_fix=True) for pc in dict.fromkeys(postcodes)
+            }
+            postcodes = [copy(parsed[pc]) for pc in postcodes if parsed[pc] is not None]
         return postcodes
     else:
-        postcodes = re.findall(POSTCODE_CORPUS_REGEX, text)
-        postcodes = [parse(postcode, attempt_fix=False) for postcode in postcodes]
-        postcodes = [postcode for postcode in postcodes if postcode is not None]
+        postcodes = POSTCODE_CORPUS_REGEX.findall(text)
+        parsed = {pc: parse(pc, attempt_fix=False) for pc in dict.fromkeys(postcodes)}
+        postcodes = [copy(parsed[pc]) for pc in postcodes if parsed[pc] is not None]
         return postcodes
 
 
+@lru_cache(maxsize=4096)
+def _outcode_incodes(outcode: str) -> Optional[Set[str]]:
+    """Load the incodes for an outcode from its bundled module (None if it doesn't exist)
+
+    Cached so repeat checks skip the import machinery, including the
+    filesystem search that a missing outcode module triggers on every import.
+    """
+    try:
+        module = importlib.import_module(
+            f"uk_postcodes_parsing.outcodes.{outcode.lower()}"
+        )
+    except ImportError:
+        return None
+    return getattr(module, "INCODES", set())
+
+
+def _in_ons_directory(outcode: str, incode: str) -> bool:
+    """Check an already-split outcode and incode against the outcode modules"""
+    incodes = _outcode_incodes(outcode)
+    return incodes is not None and incode in incodes
+
+
 def is_in_ons_postcode_directory(postcode: str) -> bool:
     """Check if the postcode is valid with ons directory
 
@@ -217,17 +259,8 @@ def is_in_ons_postcode_directory(postcode: str) -> bool:
         if not outcode or not incode:
             return False
 
-        # Try to import the outcode module dynamically
-        try:
-            import importlib
-
-            module_name = f"uk_postcodes_parsing.outcodes.{outcode.lower()}"
-            module = importlib.import_module(module_name)
-            incodes = getattr(module, "INCODES", set())
-            return incode in incodes
-        except (ImportError, AttributeError):
-            # If outcode file doesn't exist, postcode is invalid
-            return False
+        # If the outcode file doesn't exist, the postcode is invalid
+        return _in_ons_directory(outcode, incode)
 
     except Exception as e:
         logger.debug(f"Error checking postcode in outcodes: {e}")
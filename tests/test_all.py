@@ -234,3 +234,19 @@ def test_parse_from_corpus():
     assert "O00 4SS" in lst  # LNN
     assert "OO0 4SS" in lst  # LLN
     assert "O0O 4SS" in lst  # LNL
+
+
+def test_parse_from_corpus_repeated_postcodes():
+    corpus = "HA0 1AQ, then EC1R 1UB, then HA0 1AQ again"
+    lst = parse_from_corpus(corpus)
+    assert [pc.postcode for pc in lst] == ["HA0 1AQ", "EC1R 1UB", "HA0 1AQ"]
+    # Repeated matches are parsed once but returned as independent results
+    assert lst[0] == lst[2]
+    assert lst[0] is not lst[2]
+
+    lst = parse_from_corpus(
+        "HAO 1AQ HAO 1AQ", attempt_fix=True, try_all_fix_options=True
+    )
+    assert len(lst) == 2
+    assert lst[0] == lst[1]
+    assert lst[0] is not lst[1]
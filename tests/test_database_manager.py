@@ -6,6 +6,7 @@ Tests cross-platform paths, download, verification, and error handling
 import os
 import pytest
 import shutil
+import sqlite3
 import tempfile
 import threading
 from pathlib import Path
@@ -290,6 +291,27 @@ class TestDatabaseManager:
             assert info["size_mb"] == 800.0
             assert "metadata" in info
 
+    def test_get_database_info_sees_uncheckpointed_writes(self):
+        """Test cached database info notices writes still in the WAL file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = DatabaseManager()
+            manager.db_path = Path(temp_dir) / "postcodes.db"
+
+            writer = sqlite3.connect(str(manager.db_path))
+            try:
+                writer.execute("PRAGMA journal_mode=WAL")
+                writer.execute("CREATE TABLE postcodes (postcode TEXT PRIMARY KEY)")
+                writer.execute("INSERT INTO postcodes VALUES ('SW1A 1AA')")
+                writer.commit()
+                assert manager.get_database_info()["record_count"] == 1
+
+                # The open writer keeps this commit in -wal, not the main file
+                writer.execute("INSERT INTO postcodes VALUES ('SW1A 2AA')")
+                writer.commit()
+                assert manager.get_database_info()["record_count"] == 2
+            finally:
+                writer.close()
+
 
 class TestSetupFunctions:
     """Test module-level setup functions"""
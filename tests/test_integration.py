@@ -5,7 +5,7 @@ Tests database setup workflow, real-world usage patterns using actual database
 
 import pytest
 import os
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import uk_postcodes_parsing as ukp
@@ -102,51 +102,28 @@ class TestConcurrencyAndThreadSafety:
 
     def test_concurrent_database_lookups(self):
         """Test concurrent database lookups"""
-        results = []
-        errors = []
-
-        def lookup_postcodes():
-            try:
-                # Each thread does multiple lookups
-                for postcode in TEST_POSTCODES:
-                    result = ukp.lookup_postcode(postcode)
-                    if result:
-                        results.append(result)
-            except Exception as e:
-                errors.append(e)
-
-        # Run multiple threads concurrently
-        threads = [threading.Thread(target=lookup_postcodes) for _ in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        # All should succeed without errors
-        assert len(errors) == 0
-        assert len(results) > 0
+
+        def lookup_postcodes(_):
+            # Each thread does multiple lookups
+            return [ukp.lookup_postcode(postcode) for postcode in TEST_POSTCODES]
+
+        # Run multiple threads concurrently; map re-raises any thread's error
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lookup_postcodes, range(5)))
+
+        assert all(all(result is not None for result in batch) for batch in results)
 
     def test_concurrent_spatial_queries(self):
         """Test concurrent spatial queries"""
-        all_results = []
-        errors = []
 
-        def spatial_search():
-            try:
-                # Parliament Square coordinates
-                results = ukp.find_nearest(51.5014, -0.1419, radius_km=1, limit=3)
-                all_results.extend(results)
-            except Exception as e:
-                errors.append(e)
+        def spatial_search(_):
+            # Parliament Square coordinates
+            return ukp.find_nearest(51.5014, -0.1419, radius_km=1, limit=3)
 
-        threads = [threading.Thread(target=spatial_search) for _ in range(3)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            all_results = list(executor.map(spatial_search, range(3)))
 
-        assert len(errors) == 0
-        assert len(all_results) > 0
+        assert all(len(results) > 0 for results in all_results)
 
 
 class TestRealWorldUsagePatterns:
@@ -176,6 +153,12 @@ class TestRealWorldUsagePatterns:
             closest_postcode, distance = nearby[0]
             assert distance < 0.1  # Within 100m
 
+            # Same search straight from the postcode
+            around = ukp.find_nearest_to_postcode("SW1A 1AA", radius_km=1, limit=5)
+            assert [(r.postcode, d) for r, d in around] == [
+                (r.postcode, d) for r, d in nearby
+            ]
+
     def test_bulk_processing_pattern(self):
         """Test bulk postcode processing pattern"""
         postcodes_to_lookup = [
@@ -195,6 +178,10 @@ class TestRealWorldUsagePatterns:
         assert len(results) >= 3
         assert all(isinstance(r, PostcodeResult) for r in results)
 
+        # Batched lookup resolves the same postcodes with one query
+        batch = ukp.lookup_postcodes_batch(postcodes_to_lookup)
+        assert [batch[pc] for pc in postcodes_to_lookup if batch[pc]] == results
+
     def test_search_and_filter_pattern(self):
         """Test search and filter pattern"""
         # Search for SW1A postcodes (more specific to avoid SW10)
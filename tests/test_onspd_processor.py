@@ -0,0 +1,97 @@
+"""
+Test ONSPD CSV processing
+Tests the onspd_tools processor on small synthetic ONSPD CSV files
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "onspd_tools"))
+
+from onspd_processor import ONSPDProcessor  # noqa: E402
+
+HEADER = "pcd,pcds,dointr,doterm,oseast1m,osnrth1m,osgrdind,ctry,lat,long\n"
+
+
+def write_csv(path, rows):
+    path.write_text(HEADER + "".join(f"{','.join(row)}\n" for row in rows))
+
+
+def onspd_row(postcode, eastings="529090", northings="179645"):
+    return [
+        postcode.replace(" ", ""),
+        postcode,
+        "198001",
+        "",
+        eastings,
+        northings,
+        "1",
+        "E92000001",
+        "51.501009",
+        "-0.141588",
+    ]
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """Processor using the repo's lookup tables, caching them under tmp_path"""
+    monkeypatch.setattr(
+        ONSPDProcessor, "LOOKUP_CACHE_PATH", tmp_path / "cache" / "lookups.json"
+    )
+    return ONSPDProcessor(data_dir=str(REPO_ROOT / "data"))
+
+
+class TestONSPDProcessor:
+    """Test ONSPDProcessor CSV handling"""
+
+    def test_malformed_rows_do_not_drop_file(self, processor, tmp_path):
+        """Test a repeated header row and a malformed number only affect their own rows"""
+        csv_dir = tmp_path / "multi_csv"
+        csv_dir.mkdir()
+        write_csv(
+            csv_dir / "a.csv",
+            [onspd_row("SW1A 1AA"), onspd_row("SW1A 2AA"), HEADER.strip().split(",")],
+        )
+        write_csv(
+            csv_dir / "b.csv",
+            [onspd_row("E1 6AN"), onspd_row("E1 6AP", eastings="not-a-number")],
+        )
+
+        df = processor.process_onspd_csv_directory(str(csv_dir), max_workers=1)
+
+        assert sorted(df["postcode"]) == ["E1 6AN", "E1 6AP", "SW1A 1AA", "SW1A 2AA"]
+        rows = df.set_index("postcode")
+        assert rows.loc["SW1A 1AA", "eastings"] == 529090
+        assert rows.loc["SW1A 1AA", "coordinate_quality"] == 1
+        # The malformed grid reference is null, and so is the coordinate depending on it
+        assert rows["eastings"].isna().sum() == 1
+        assert rows.loc["E1 6AP", "northings"] == 179645
+        assert rows["longitude"].isna().sum() == 1
+        assert rows.loc["E1 6AP", "latitude"] == pytest.approx(51.501009)
+
+    def test_failed_file_is_counted(self, processor, tmp_path):
+        """Test a CSV that can't be processed is reported rather than ignored"""
+        stats = processor._process_csv_file_to_parquet(
+            str(tmp_path / "missing.csv"), str(tmp_path / "part.parquet")
+        )
+
+        assert stats.failed_files == 1
+        assert not (tmp_path / "part.parquet").exists()
+
+    def test_lookup_cache_round_trip(self, processor, tmp_path):
+        """Test the JSON lookup cache reloads the same normalized tables"""
+        cache_path = ONSPDProcessor.LOOKUP_CACHE_PATH
+        assert cache_path.read_text(encoding="utf-8").startswith("{")
+
+        cached = ONSPDProcessor(data_dir=str(REPO_ROOT / "data"))
+
+        assert "lookup_tables" not in vars(cached)  # Raw JSON never parsed
+        assert cached._lookup_series.keys() == processor._lookup_series.keys()
+        for name, series in processor._lookup_series.items():
+            assert cached._lookup_series[name].equals(series)
@@ -78,6 +78,20 @@ class TestOutcodeValidation:
         result = is_in_ons_postcode_directory("ZZ9 9ZZ")
         assert result is False  # Should return False, not crash
 
+    def test_outcode_lookups_are_cached(self):
+        """Test outcode modules (and missing outcodes) are only imported once"""
+        from unittest.mock import patch
+        from uk_postcodes_parsing import ukpostcode
+
+        ukpostcode._outcode_incodes.cache_clear()
+        with patch.object(
+            ukpostcode.importlib, "import_module", wraps=importlib.import_module
+        ) as mock_import:
+            for _ in range(3):
+                assert is_in_ons_postcode_directory("SW1A 1AA") is True
+                assert is_in_ons_postcode_directory("ZZ9 9ZZ") is False
+            assert mock_import.call_count == 2
+
     def test_invalid_postcode_format_handling(self):
         """Test handling of invalid postcode formats"""
         invalid_formats = [
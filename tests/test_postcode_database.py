@@ -4,6 +4,8 @@ Tests PostcodeResult dataclass, database lookups, and field mapping
 """
 
 import pytest
+import os
+import shutil
 import sqlite3
 import tempfile
 import threading
@@ -176,10 +178,29 @@ class TestPostcodeResult:
 class TestPostcodeDatabase:
     """Test PostcodeDatabase class functionality"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def template_database(cls, tmp_path_factory):
+        """Build the mock database once per class; tests get their own copy"""
+        cls.template_db_path = cls.build_template_database(
+            tmp_path_factory.mktemp("template")
+        )
+
     def create_mock_database(self, temp_dir):
+        """Copy the template mock database into temp_dir for one test"""
+        db_path = Path(temp_dir) / "test_postcodes.db"
+        shutil.copyfile(self.template_db_path, db_path)
+        return db_path
+
+    @staticmethod
+    def build_template_database(temp_dir):
         """Create a mock SQLite database for testing"""
         db_path = Path(temp_dir) / "test_postcodes.db"
         conn = sqlite3.connect(str(db_path))
+        # Same journal mode as databases from the ONSPD builder, so concurrent
+        # readers take the WAL path production uses
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
 
         # Create postcodes table with test data
         conn.execute(
@@ -488,6 +509,38 @@ class TestPostcodeDatabase:
                 f"Results: {results}. Errors: {errors}. Platform: {platform.system()}"
             )
 
+    def test_concurrent_access_with_reused_connections(self):
+        """Test concurrent lookups through per-thread reused connections"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path), reuse_connections=True)
+            barrier = threading.Barrier(5, timeout=10.0)
+            results = {}
+
+            def lookup_postcodes(index):
+                barrier.wait()  # Start every thread's first query together
+                results[index] = [
+                    db.lookup_batch(["SW1A 1AA"])["SW1A 1AA"] is not None,
+                    len(db.search("SW1")) >= 3,
+                    len(db.get_outcode_postcodes("SW1E")) == 1,
+                ]
+                barrier.wait()  # Stay alive until every thread has connected
+
+            threads = [
+                threading.Thread(target=lookup_postcodes, args=(i,)) for i in range(5)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10.0)
+
+            try:
+                assert results == {i: [True, True, True] for i in range(5)}
+                # One connection per thread, none shared between them
+                assert len(db._open_connections) == 5
+            finally:
+                db.close()
+
     def test_lookup_existing_postcode(self):
         """Test lookup of existing postcode"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -558,6 +611,26 @@ class TestPostcodeDatabase:
             results = db.search("")
             assert results == []
 
+    def test_search_prefix_bounds(self):
+        """Test search only returns postcodes starting with the query"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            results = db.search(" sw1e ")
+            assert [r.postcode for r in results] == ["SW1E 6LA"]
+
+            results = db.search("SW1A")
+            assert results
+            assert all(r.postcode.startswith("SW1A") for r in results)
+            assert db.search("   ") == []
+
+            # Prefixes whose last character has no successor or one that
+            # would be a surrogate still search like LIKE did
+            assert db.search("SW1\U0010ffff") == []
+            assert db.search("\U0010ffff") == []
+            assert db.search("SW\ud7ff") == []
+
     def test_get_outcode_postcodes(self):
         """Test getting all postcodes in an outcode"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -584,6 +657,88 @@ class TestPostcodeDatabase:
             assert results1 == results2
             assert len(results1) == 1
 
+            results1[0].postcode = "Changed"
+            results1.clear()
+            assert db.get_outcode_postcodes("SW1A")[0].postcode == "SW1A 1AA"
+
+    def test_lookup_caching(self):
+        """Test lookup results are cached by normalized postcode"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            result1 = db.lookup("SW1A 1AA")
+
+            # Different formatting of the same postcode should not hit the database
+            with patch.object(
+                db, "_execute_query_one", return_value=None
+            ) as mock_query:
+                result2 = db.lookup("sw1a1aa")
+                assert db.lookup("FAKE 123") is None
+                assert mock_query.call_count == 1
+
+            assert result2 == result1
+
+            # Each caller gets its own copy of the cached result
+            result2.district = "Changed"
+            assert db.lookup("SW1A 1AA").district == "Westminster"
+
+            db.clear_cache()
+            assert db.lookup("SW1A 1AA") == result1
+
+    def test_lookup_batch(self):
+        """Test batch lookup resolves many postcodes in a single query"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            postcodes = ["SW1A 1AA", "sw1e6la", "FAKE 123", "SW1A 1AA", ""]
+
+            with patch.object(
+                db, "_execute_query", wraps=db._execute_query
+            ) as mock_query:
+                results = db.lookup_batch(postcodes)
+                assert mock_query.call_count == 1
+
+            assert list(results) == ["SW1A 1AA", "sw1e6la", "FAKE 123", ""]
+            assert results["SW1A 1AA"].district == "Westminster"
+            assert results["sw1e6la"].postcode == "SW1E 6LA"
+            assert results["FAKE 123"] is None
+            assert results[""] is None
+
+            # Batch results populate the single lookup cache
+            with patch.object(db, "_execute_query_one") as mock_query:
+                assert db.lookup("SW1E 6LA") == results["sw1e6la"]
+                mock_query.assert_not_called()
+
+    def test_lookup_batch_chunks_parameters(self):
+        """Test batch lookup splits large inputs across several queries"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            db.MAX_QUERY_PARAMS = 4
+
+            with patch.object(
+                db, "_execute_query", wraps=db._execute_query
+            ) as mock_query:
+                results = db.lookup_batch(["SW1A 1AA", "SW1E 6LA", "SW1P 3AD"])
+                assert mock_query.call_count == 2
+
+            assert all(result is not None for result in results.values())
+
+    def test_outcode_cache_is_bounded(self):
+        """Test least recently used outcodes are evicted from the cache"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            db.OUTCODE_CACHE_SIZE = 2
+
+            db.get_outcode_postcodes("SW1A")
+            db.get_outcode_postcodes("SW1E")
+            db.get_outcode_postcodes("SW1A")  # Mark SW1A as recently used
+            db.get_outcode_postcodes("SW1P")
+
+            assert list(db._outcode_cache) == ["SW1A", "SW1P"]
+
     def test_get_area_postcodes_district(self):
         """Test getting postcodes by district"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -621,6 +776,24 @@ class TestPostcodeDatabase:
             with pytest.raises(ValueError, match="Invalid area_type"):
                 db.get_area_postcodes("invalid_type", "test")
 
+    def test_iter_area_postcodes(self):
+        """Test streaming area postcodes matches the list API"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            db.STREAM_BATCH_SIZE = 1  # Exercise several fetch batches
+
+            expected = db.get_area_postcodes("country", "England")
+            results = db.iter_area_postcodes("country", "England")
+
+            assert not isinstance(results, list)
+            assert list(results) == expected
+            assert len(expected) == 4
+
+            # Invalid area types are rejected before iteration starts
+            with pytest.raises(ValueError, match="Invalid area_type"):
+                db.iter_area_postcodes("invalid_type", "test")
+
     def test_get_statistics(self):
         """Test database statistics"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -637,6 +810,46 @@ class TestPostcodeDatabase:
             assert "database_path" in stats
             assert "database_size_mb" in stats
 
+    def test_get_statistics_caching(self):
+        """Test statistics are reused until the database file changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            stats = db.get_statistics()
+            stats["countries"].clear()  # Callers get their own copy
+
+            with patch.object(db, "_execute_query_one") as mock_query:
+                assert db.get_statistics()["countries"]["England"] == 4
+                mock_query.assert_not_called()
+
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("DELETE FROM postcodes WHERE postcode = 'SW1A 1AA'")
+            conn.commit()
+            conn.close()
+            os.utime(db_path, ns=(0, 0))  # Ensure the mtime visibly changes
+
+            assert db.get_statistics()["total_postcodes"] == 3
+
+    def test_get_statistics_sees_uncheckpointed_writes(self):
+        """Test statistics notice writes still in the WAL file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            assert db.get_statistics()["total_postcodes"] == 4
+            main_stat = db_path.stat()
+
+            # An open writer keeps the commit in -wal instead of the main file
+            conn = sqlite3.connect(str(db_path))
+            try:
+                conn.execute("DELETE FROM postcodes WHERE postcode = 'SW1A 1AA'")
+                conn.commit()
+                assert db_path.stat().st_mtime_ns == main_stat.st_mtime_ns
+
+                assert db.get_statistics()["total_postcodes"] == 3
+            finally:
+                conn.close()
+
     def test_close_connection(self):
         """Test closing database connections"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -649,6 +862,101 @@ class TestPostcodeDatabase:
             # Close should work without error
             db.close()
 
+    def test_reuse_connections(self):
+        """Test per-thread connection reuse and closing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            db = PostcodeDatabase(str(db_path), reuse_connections=True)
+
+            assert db.lookup("SW1A 1AA") is not None
+            assert len(db.search("SW1")) >= 3
+            assert len(db._open_connections) == 1
+
+            # Each thread gets its own connection
+            thread = threading.Thread(target=db.get_outcode_postcodes, args=("SW1E",))
+            thread.start()
+            thread.join()
+            assert len(db._open_connections) == 2
+
+            # A finished thread's connection is closed when a new one is opened
+            thread = threading.Thread(target=db.get_outcode_postcodes, args=("SW1P",))
+            thread.start()
+            thread.join()
+            assert len(db._open_connections) == 2
+
+            db.close()
+            assert db._open_connections == []
+
+            # Queries after close() transparently open a new connection
+            db.clear_cache()
+            assert db.lookup("SW1A 1AA") is not None
+            db.close()
+
+    @patch("uk_postcodes_parsing.database_manager.DatabaseManager._indices_exist")
+    @patch("lzma.open")
+    @patch("urllib.request.urlretrieve")
+    def test_replaced_database_is_reopened(
+        self, mock_urlretrieve, mock_lzma_open, mock_indices_exist
+    ):
+        """Test the shared instance sees a re-downloaded database file"""
+        import uk_postcodes_parsing.postcode_database as pdb
+        from uk_postcodes_parsing.database_manager import DatabaseManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+
+            # The "downloaded" database no longer has SW1A 1AA
+            download_path = Path(temp_dir) / "download.db"
+            shutil.copyfile(self.template_db_path, download_path)
+            conn = sqlite3.connect(str(download_path))
+            conn.execute("DELETE FROM postcodes WHERE postcode = 'SW1A 1AA'")
+            conn.commit()
+            conn.close()
+
+            mock_urlretrieve.side_effect = lambda url, path, hook=None: Path(
+                path
+            ).write_bytes(b"compressed")
+            mock_lzma_open.side_effect = lambda path, mode: open(download_path, mode)
+            mock_indices_exist.return_value = True
+
+            manager = DatabaseManager()
+            manager.data_dir = Path(temp_dir)
+            manager.db_path = db_path
+
+            with patch.object(pdb, "_db_instance", None):
+                old_db = get_database(str(db_path))
+                assert old_db.lookup("SW1A 1AA") is not None
+
+                manager._download_database()
+
+                assert pdb._db_instance is None
+                # References to the old instance don't serve cached results
+                assert old_db.lookup("SW1A 1AA") is None
+                db = get_database(str(db_path))
+                assert db.lookup("SW1A 1AA") is None
+                assert db.lookup("SW1E 6LA") is not None
+                db.close()
+
+    def test_remove_database_releases_shared_instance(self):
+        """Test removing the database file closes the shared instance first"""
+        import uk_postcodes_parsing.postcode_database as pdb
+        from uk_postcodes_parsing.database_manager import DatabaseManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_mock_database(temp_dir)
+            manager = DatabaseManager()
+            manager.db_path = db_path
+
+            with patch.object(pdb, "_db_instance", None):
+                db = get_database(str(db_path))
+                assert db.lookup("SW1A 1AA") is not None
+
+                manager.remove_database()
+
+                assert pdb._db_instance is None
+                assert db._open_connections == []
+                assert not db_path.exists()
+
 
 class TestDatabaseSingleton:
     """Test global database instance management"""
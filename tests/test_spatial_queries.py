@@ -5,10 +5,12 @@ Tests distance calculations, nearest neighbor search, and reverse geocoding
 
 import pytest
 import math
+import shutil
 import sqlite3
 import tempfile
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 from uk_postcodes_parsing.postcode_database import PostcodeDatabase, PostcodeResult
 
@@ -16,10 +18,29 @@ from uk_postcodes_parsing.postcode_database import PostcodeDatabase, PostcodeRes
 class TestSpatialQueries:
     """Test spatial query functionality with known geographic data"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def template_database(cls, tmp_path_factory):
+        """Build the London test database once per class; tests get their own copy"""
+        cls.template_db_path = cls.build_template_database(
+            tmp_path_factory.mktemp("template")
+        )
+
     def create_london_test_database(self, temp_dir):
+        """Copy the template London database into temp_dir for one test"""
+        db_path = Path(temp_dir) / "london_postcodes.db"
+        shutil.copyfile(self.template_db_path, db_path)
+        return db_path
+
+    @staticmethod
+    def build_template_database(temp_dir):
         """Create test database with London postcodes and known distances"""
         db_path = Path(temp_dir) / "london_postcodes.db"
         conn = sqlite3.connect(str(db_path))
+        # Same journal mode as databases from the ONSPD builder, so concurrent
+        # readers take the WAL path production uses
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
 
         # Create postcodes table
         conn.execute(
@@ -294,6 +315,145 @@ class TestSpatialQueries:
 
             assert len(results) == 0
 
+    def test_find_nearest_exact_coordinates(self):
+        """Test a postcode at the exact search coordinates is found at distance 0"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            results = db.find_nearest(51.538067, -0.099181, radius_km=1, limit=1)
+
+            assert len(results) == 1
+            assert results[0][0].postcode == "N1 9AA"
+            assert results[0][1] == pytest.approx(0.0, abs=1e-6)
+
+    def test_find_nearest_with_location_index(self):
+        """Test the R*Tree location index returns the same results as the scan"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            expected = db.find_nearest(51.5014, -0.1419, radius_km=5, limit=4)
+            assert not db._has_location_index()
+
+            db.create_location_index()
+            assert db._has_location_index()
+
+            # A fresh instance detects the index on its own
+            indexed_db = PostcodeDatabase(str(db_path))
+            results = indexed_db.find_nearest(51.5014, -0.1419, radius_km=5, limit=4)
+
+            assert indexed_db._has_location_index()
+            assert [r.postcode for r, _ in results] == [
+                r.postcode for r, _ in expected
+            ]
+            for (_, distance), (_, expected_distance) in zip(results, expected):
+                assert distance == pytest.approx(expected_distance)
+
+    def test_find_nearest_location_index_edge_of_radius(self):
+        """Test postcodes just outside the radius don't crowd out ones inside it"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            origin = (55.0, -3.0)
+
+            def offset(distance_km):
+                # Diagonally from the origin, well inside the bounding box
+                step = distance_km * math.sqrt(0.5) / 111.195
+                return (
+                    origin[0] + step,
+                    origin[1] + step / math.cos(math.radians(origin[0])),
+                )
+
+            conn = sqlite3.connect(str(db_path))
+            for postcode, distance_km in [
+                ("DG1 1AA", 0.5),
+                ("DG1 1AB", 0.99),
+                ("DG1 1AC", 1.003),
+            ]:
+                outcode, incode = postcode.split()
+                conn.execute(
+                    "INSERT INTO postcodes (postcode, pc_compact, incode, outcode, "
+                    "latitude, longitude) VALUES (?, ?, ?, ?, ?, ?)",
+                    (postcode, outcode + incode, incode, outcode) + offset(distance_km),
+                )
+            conn.commit()
+            conn.close()
+
+            db = PostcodeDatabase(str(db_path))
+            db.create_location_index()
+            # Index coordinates are approximate: make DG1 1AB rank after DG1 1AC
+            db.LOCATION_INDEX_SLACK_KM = 0.01
+            lat, lon = offset(1.008)
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(
+                "UPDATE postcodes_location SET min_lat = ?, max_lat = ?, "
+                "min_lon = ?, max_lon = ? WHERE id = "
+                "(SELECT rowid FROM postcodes WHERE postcode = 'DG1 1AB')",
+                (lat, lat, lon, lon),
+            )
+            conn.commit()
+            conn.close()
+
+            results = db.find_nearest(*origin, radius_km=1, limit=2)
+
+            scan_db = PostcodeDatabase(str(db_path))
+            scan_db._location_index = False
+            expected = scan_db.find_nearest(*origin, radius_km=1, limit=2)
+
+            assert [r.postcode for r, _ in expected] == ["DG1 1AA", "DG1 1AB"]
+            assert [r.postcode for r, _ in results] == [r.postcode for r, _ in expected]
+            for (_, distance), (_, expected_distance) in zip(results, expected):
+                assert distance == pytest.approx(expected_distance)
+
+    def test_find_nearest_invalid_search_area(self):
+        """Test impossible searches return no results without querying"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            with patch.object(db, "_execute_query") as mock_query:
+                assert db.find_nearest(999, 999) == []
+                assert db.find_nearest(51.5014, -0.1419, radius_km=-1) == []
+                assert db.find_nearest(float("nan"), -0.1419) == []
+                assert db.reverse_geocode(-91, 0) is None
+                mock_query.assert_not_called()
+
+            results = db.find_nearest_many([(999, 999), (51.5014, -0.1419)])
+            assert results[0] == []
+            assert results[1]
+
+    def test_find_nearest_many(self):
+        """Test batched nearest searches match individual find_nearest calls"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+            points = [(51.5014, -0.1419), (51.5155, -0.0922), (0.0, 0.0)]
+
+            results = db.find_nearest_many(points, radius_km=5, limit=3)
+
+            assert len(results) == len(points)
+            for (lat, lon), batch in zip(points, results):
+                expected = db.find_nearest(lat, lon, radius_km=5, limit=3)
+                assert [(r.postcode, d) for r, d in batch] == [
+                    (r.postcode, d) for r, d in expected
+                ]
+            assert results[2] == []
+
+    def test_find_nearest_to_postcode(self):
+        """Test nearest postcodes around a postcode match a coordinate search"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = self.create_london_test_database(temp_dir)
+            db = PostcodeDatabase(str(db_path))
+
+            results = db.find_nearest_to_postcode("sw1a1aa", radius_km=2, limit=3)
+            expected = db.find_nearest(51.501009, -0.141588, radius_km=2, limit=3)
+
+            assert results[0][0].postcode == "SW1A 1AA"
+            assert results[0][1] == pytest.approx(0.0, abs=1e-6)
+            assert [(r.postcode, d) for r, d in results] == [
+                (r.postcode, d) for r, d in expected
+            ]
+            assert db.find_nearest_to_postcode("ZZ99 9ZZ") == []
+
     def test_reverse_geocode_parliament(self):
         """Test reverse geocoding to find Parliament Square postcode"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -387,8 +547,10 @@ class TestSpatialQueries:
         with tempfile.TemporaryDirectory() as temp_dir:
             db_path = self.create_london_test_database(temp_dir)
 
-            # Add more test data for performance testing
+            # Add more test data for performance testing; the throwaway copy
+            # doesn't need its commit synced to disk
             conn = sqlite3.connect(str(db_path))
+            conn.execute("PRAGMA synchronous=OFF")
 
             # Generate grid of test postcodes around London
             test_data = []